@@ -1,19 +1,59 @@
-"""Core modules for mut."""
-
-from mutcli.core.ai_analyzer import AIAnalyzer
-from mutcli.core.config import ConfigLoader, MutConfig, RetryConfig, TimeoutConfig
-from mutcli.core.device_controller import DeviceController
-from mutcli.core.executor import StepResult, TestExecutor, TestResult
-from mutcli.core.frame_extractor import FrameExtractor
-from mutcli.core.parser import ParseError, TestParser
-from mutcli.core.recorder import Recorder, RecordingState
-from mutcli.core.report import ReportGenerator
-from mutcli.core.scrcpy_service import ScrcpyService
-from mutcli.core.step_analyzer import AnalyzedStep, StepAnalyzer
-from mutcli.core.touch_monitor import TouchEvent, TouchMonitor
-from mutcli.core.typing_detector import TypingDetector, TypingSequence
-from mutcli.core.verification_suggester import VerificationPoint, VerificationSuggester
-from mutcli.core.yaml_generator import YAMLGenerator
+"""Core modules for mut.
+
+Public names are imported lazily on first attribute access (PEP 562), so
+importing a single submodule such as ``mutcli.core.typing_detector`` does
+not pull in scrcpy, the AI client, or the rest of the package.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from mutcli.core.ai_analyzer import AIAnalyzer
+    from mutcli.core.config import ConfigLoader, MutConfig, RetryConfig, TimeoutConfig
+    from mutcli.core.device_controller import DeviceController
+    from mutcli.core.executor import StepResult, TestExecutor, TestResult
+    from mutcli.core.frame_extractor import FrameExtractor
+    from mutcli.core.parser import ParseError, TestParser
+    from mutcli.core.recorder import Recorder, RecordingState
+    from mutcli.core.report import ReportGenerator
+    from mutcli.core.scrcpy_service import ScrcpyService
+    from mutcli.core.step_analyzer import AnalyzedStep, StepAnalyzer
+    from mutcli.core.touch_monitor import TouchEvent, TouchMonitor
+    from mutcli.core.typing_detector import TypingDetector, TypingSequence
+    from mutcli.core.verification_suggester import VerificationPoint, VerificationSuggester
+    from mutcli.core.yaml_generator import YAMLGenerator
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS = {
+    "AIAnalyzer": "ai_analyzer",
+    "AnalyzedStep": "step_analyzer",
+    "ConfigLoader": "config",
+    "DeviceController": "device_controller",
+    "FrameExtractor": "frame_extractor",
+    "MutConfig": "config",
+    "ParseError": "parser",
+    "Recorder": "recorder",
+    "RecordingState": "recorder",
+    "ReportGenerator": "report",
+    "RetryConfig": "config",
+    "ScrcpyService": "scrcpy_service",
+    "StepAnalyzer": "step_analyzer",
+    "StepResult": "executor",
+    "TestExecutor": "executor",
+    "TestParser": "parser",
+    "TestResult": "executor",
+    "TimeoutConfig": "config",
+    "TouchEvent": "touch_monitor",
+    "TouchMonitor": "touch_monitor",
+    "TypingDetector": "typing_detector",
+    "TypingSequence": "typing_detector",
+    "VerificationPoint": "verification_suggester",
+    "VerificationSuggester": "verification_suggester",
+    "YAMLGenerator": "yaml_generator",
+}
 
 __all__ = [
     "AIAnalyzer",
@@ -42,3 +82,17 @@ __all__ = [
     "VerificationSuggester",
     "YAMLGenerator",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its submodule on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -47,7 +47,7 @@ Respond with JSON only:
 "element_type": "button|text_field|link|icon|other"}}'''
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalyzedStep:
     """Result of analyzing a single step.
 
@@ -1,10 +1,12 @@
 """Touch event monitoring via adb getevent."""
 
 import logging
+import math
 import re
 import subprocess
 import threading
 import time
+from collections import deque
 from dataclasses import dataclass
 from typing import Any
 
@@ -12,8 +14,11 @@ from mutcli.core.adb_state_monitor import ADBStateMonitor
 
 logger = logging.getLogger("mut.touch")
 
+# getevent -lt line: [timestamp] /dev/input/eventX: TYPE CODE VALUE
+GETEVENT_LINE_PATTERN = re.compile(r"\[\s*([\d.]+)\]\s+\S+:\s+(\w+)\s+(\w+)\s+(\w+)")
 
-@dataclass
+
+@dataclass(slots=True)
 class TrajectoryPoint:
     """A single point in a touch trajectory."""
     timestamp: float  # Seconds since monitoring started
@@ -72,7 +77,7 @@ class TouchMonitor:
     """Monitor touch events via adb getevent.
 
     Captures touch events from an Android device using `adb getevent -lt`.
-    Runs in a background thread and stores events in a thread-safe list.
+    Runs in a background thread and stores events in a lock-guarded deque.
     Coordinates are automatically scaled from touch panel to screen pixels.
 
     Gesture classification:
@@ -101,7 +106,8 @@ class TouchMonitor:
             device_id: ADB device identifier
         """
         self._device_id = device_id
-        self._events: list[TouchEvent] = []
+        # Unbounded deque: O(1) appends from the reader thread, no list regrowth
+        self._events: deque[TouchEvent] = deque()
         self._lock = threading.Lock()
         self._running = False
         self._thread: threading.Thread | None = None
@@ -350,11 +356,12 @@ class TouchMonitor:
         Args:
             line: Raw getevent output line
         """
-        # Match getevent format with -lt flags
-        match = re.match(
-            r"\[\s*([\d.]+)\]\s+\S+:\s+(\w+)\s+(\w+)\s+(\w+)",
-            line,
-        )
+        # Fast reject: only position updates and BTN_TOUCH matter, and
+        # EV_SYN / other key lines make up most of getevent output
+        if "EV_ABS" not in line and "BTN_TOUCH" not in line:
+            return
+
+        match = GETEVENT_LINE_PATTERN.match(line)
         if not match:
             return
 
@@ -437,10 +444,8 @@ class TouchMonitor:
             return 0.0
 
         total_distance = 0.0
-        for i in range(1, len(trajectory)):
-            dx = trajectory[i].x - trajectory[i - 1].x
-            dy = trajectory[i].y - trajectory[i - 1].y
-            total_distance += (dx ** 2 + dy ** 2) ** 0.5
+        for prev, point in zip(trajectory, trajectory[1:]):
+            total_distance += math.hypot(point.x - prev.x, point.y - prev.y)
 
         return total_distance
 
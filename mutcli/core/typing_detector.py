@@ -1,9 +1,18 @@
 """Typing detection from touch events."""
 
+from bisect import bisect_right
+from collections.abc import Sequence
 from dataclasses import dataclass
+from operator import itemgetter
 
+import numpy as np
 
-@dataclass
+# C-level field accessors for touch event dicts
+_get_y = itemgetter("y")
+_get_timestamp = itemgetter("timestamp")
+
+
+@dataclass(slots=True, frozen=True)
 class TypingSequence:
     """A detected typing sequence from touch events.
 
@@ -12,7 +21,8 @@ class TypingSequence:
         end_index: Index of last tap in sequence (inclusive)
         tap_count: Number of taps in the sequence
         duration: Total duration in seconds
-        text: User-provided text (filled later via interview)
+        text: User-provided text (filled later via interview,
+            using dataclasses.replace since instances are frozen)
     """
 
     start_index: int
@@ -65,7 +75,13 @@ class TypingDetector:
                 visibility instead of heuristics.
         """
         self._screen_height = screen_height
+        # Taps below this Y coordinate are in the keyboard area. Kept as a
+        # float: truncating to int could move the boundary by one pixel.
+        self._keyboard_boundary = screen_height * (1 - self.KEYBOARD_THRESHOLD)
         self._keyboard_states = keyboard_states or []
+        # Parallel arrays for binary search (states are in time order)
+        self._keyboard_timestamps = [ts for ts, _ in self._keyboard_states]
+        self._keyboard_visibility = [visible for _, visible in self._keyboard_states]
 
     def is_keyboard_tap(self, y: int) -> bool:
         """Check if Y coordinate is in keyboard area (bottom 40%).
@@ -76,8 +92,7 @@ class TypingDetector:
         Returns:
             True if tap is in keyboard area, False otherwise
         """
-        keyboard_boundary = self._screen_height * (1 - self.KEYBOARD_THRESHOLD)
-        return y > keyboard_boundary
+        return y > self._keyboard_boundary
 
     def _is_keyboard_visible_at(self, timestamp: float) -> bool | None:
         """Check if keyboard was visible at given timestamp.
@@ -94,15 +109,12 @@ class TypingDetector:
             return None  # No data - signal to use heuristics
 
         # Find closest state before or at timestamp
-        result = None
-        for ts, visible in self._keyboard_states:
-            if ts <= timestamp:
-                result = visible
-            else:
-                break
-        return result
-
-    def detect(self, touch_events: list[dict]) -> list[TypingSequence]:
+        index = bisect_right(self._keyboard_timestamps, timestamp) - 1
+        if index < 0:
+            return None  # Before first known state
+        return self._keyboard_visibility[index]
+
+    def detect(self, touch_events: Sequence[dict]) -> list[TypingSequence]:
         """Detect typing sequences in touch events.
 
         Analyzes touch events to find sequences of keyboard taps.
@@ -110,94 +122,79 @@ class TypingDetector:
         area with <= 1 second between each tap.
 
         Args:
-            touch_events: List of dicts with 'x', 'y', 'timestamp' keys
+            touch_events: Sequence of dicts with 'x', 'y', 'timestamp' keys
 
         Returns:
             List of detected TypingSequence objects
         """
-        if not touch_events:
+        # Too few events for any sequence: skip array setup entirely
+        if len(touch_events) < self.MIN_SEQUENCE_LENGTH:
             return []
 
-        sequences: list[TypingSequence] = []
-        current_sequence_start: int | None = None
-        prev_timestamp: float | None = None
+        count = len(touch_events)
+        ys = np.fromiter(map(_get_y, touch_events), dtype=np.float64, count=count)
+        timestamps = np.fromiter(map(_get_timestamp, touch_events), dtype=np.float64, count=count)
+        return self.detect_arrays(ys, timestamps)
 
-        for i, event in enumerate(touch_events):
-            y = event["y"]
-            timestamp = event["timestamp"]
+    def detect_arrays(self, ys: np.ndarray, timestamps: np.ndarray) -> list[TypingSequence]:
+        """Detect typing sequences from parallel coordinate/time arrays.
 
-            # Use actual keyboard visibility if available, fall back to heuristics
-            keyboard_visible = self._is_keyboard_visible_at(timestamp)
-            if keyboard_visible is not None:
-                is_keyboard = keyboard_visible
-            else:
-                is_keyboard = self.is_keyboard_tap(y)
+        Same rules as detect(), for callers that already hold touch data
+        as arrays instead of per-event dicts.
 
-            time_gap_ok = (
-                prev_timestamp is None
-                or timestamp - prev_timestamp <= self.MAX_TAP_INTERVAL
-            )
+        Args:
+            ys: Y coordinate of each touch event in pixels
+            timestamps: Timestamp of each touch event in seconds (ascending)
+
+        Returns:
+            List of detected TypingSequence objects
+        """
+        if len(timestamps) < self.MIN_SEQUENCE_LENGTH:
+            return []
+
+        keyboard = self._keyboard_mask(ys, timestamps)
+        if not keyboard.any():
+            return []
 
-            if is_keyboard and time_gap_ok:
-                # Continue or start a keyboard sequence
-                if current_sequence_start is None:
-                    current_sequence_start = i
-                prev_timestamp = timestamp
-            else:
-                # Sequence ends (non-keyboard tap or time gap)
-                if current_sequence_start is not None:
-                    sequence = self._create_sequence(
-                        touch_events, current_sequence_start, i - 1
-                    )
-                    if sequence is not None:
-                        sequences.append(sequence)
-                    current_sequence_start = None
-
-                # If this is a keyboard tap with time gap, start new potential sequence
-                if is_keyboard:
-                    current_sequence_start = i
-                    prev_timestamp = timestamp
-                else:
-                    prev_timestamp = None
-
-        # Handle sequence at end of events
-        if current_sequence_start is not None:
-            sequence = self._create_sequence(
-                touch_events, current_sequence_start, len(touch_events) - 1
+        # continues[i] is True when event i + 1 extends the run containing event i
+        continues = (
+            keyboard[:-1] & keyboard[1:] & (np.diff(timestamps) <= self.MAX_TAP_INTERVAL)
+        )
+        starts = np.flatnonzero(keyboard & ~np.r_[False, continues]).tolist()
+        ends = np.flatnonzero(keyboard & ~np.r_[continues, False]).tolist()
+
+        # Keep only runs meeting the minimum length
+        min_length = self.MIN_SEQUENCE_LENGTH
+        return [
+            TypingSequence(
+                start_index=start,
+                end_index=end,
+                tap_count=end - start + 1,
+                duration=float(timestamps[end] - timestamps[start]),
             )
-            if sequence is not None:
-                sequences.append(sequence)
+            for start, end in zip(starts, ends)
+            if end - start + 1 >= min_length
+        ]
 
-        return sequences
+    def _keyboard_mask(self, ys: np.ndarray, timestamps: np.ndarray) -> np.ndarray:
+        """Classify every touch event as keyboard / non-keyboard.
 
-    def _create_sequence(
-        self,
-        touch_events: list[dict],
-        start_index: int,
-        end_index: int,
-    ) -> TypingSequence | None:
-        """Create a TypingSequence if it meets minimum length requirement.
+        Uses actual keyboard visibility if available, falls back to heuristics
+        for events without a preceding keyboard state.
 
         Args:
-            touch_events: List of touch event dicts
-            start_index: Index of first tap in sequence
-            end_index: Index of last tap in sequence (inclusive)
+            ys: Y coordinate of each touch event
+            timestamps: Timestamp of each touch event
 
         Returns:
-            TypingSequence if valid, None if too short
+            Boolean array, True for keyboard taps
         """
-        tap_count = end_index - start_index + 1
-
-        if tap_count < self.MIN_SEQUENCE_LENGTH:
-            return None
-
-        start_timestamp = touch_events[start_index]["timestamp"]
-        end_timestamp = touch_events[end_index]["timestamp"]
-        duration = end_timestamp - start_timestamp
+        heuristic = ys > self._keyboard_boundary
+        if not self._keyboard_states:
+            return heuristic
 
-        return TypingSequence(
-            start_index=start_index,
-            end_index=end_index,
-            tap_count=tap_count,
-            duration=duration,
-        )
+        # Same lookup as _is_keyboard_visible_at, for all events at once
+        state_index = np.searchsorted(self._keyboard_timestamps, timestamps, side="right") - 1
+        known = state_index >= 0
+        visible = np.asarray(self._keyboard_visibility, dtype=bool)[np.maximum(state_index, 0)]
+        return np.where(known, visible, heuristic)
@@ -1,14 +1,21 @@
 """Parse UI elements from uiautomator XML dumps."""
 
+import hashlib
+import io
 import re
+import sys
 import xml.etree.ElementTree as ET
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
 
+# uiautomator bounds attribute: "[left,top][right,bottom]"
+BOUNDS_PATTERN = re.compile(r"\[(\d+),(\d+)\]\[(\d+),(\d+)\]")
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class UIElement:
-    """Parsed UI element from uiautomator dump."""
+    """Parsed UI element from uiautomator dump (immutable, shared by the parse cache)."""
 
     class_name: str
     text: str | None
@@ -31,7 +38,19 @@ class UIElement:
 
 
 class UIElementParser:
-    """Parse uiautomator XML dumps to find UI elements."""
+    """Parse uiautomator XML dumps to find UI elements.
+
+    parse_xml_string() results are memoized per instance (LRU keyed by a
+    hash of the XML), since unchanged screens are dumped repeatedly while
+    recording. Cached UIElement objects are shared between calls; they are
+    frozen, so no caller can alter another caller's results.
+    """
+
+    PARSE_CACHE_SIZE = 32  # Distinct dumps kept in the parse cache
+
+    def __init__(self) -> None:
+        """Initialize parser with an empty parse cache."""
+        self._parse_cache: OrderedDict[bytes, list[UIElement]] = OrderedDict()
 
     def parse_xml_file(self, path: Path) -> list[UIElement]:
         """Parse XML file to list of UI elements.
@@ -42,8 +61,7 @@ class UIElementParser:
         Returns:
             List of UIElement objects
         """
-        tree = ET.parse(path)
-        return self._parse_tree(tree.getroot())
+        return self._parse_stream(path)
 
     def parse_xml_string(self, xml_string: str) -> list[UIElement]:
         """Parse XML string to list of UI elements.
@@ -52,39 +70,68 @@ class UIElementParser:
             xml_string: XML content as string
 
         Returns:
-            List of UIElement objects
+            List of UIElement objects (a new list on every call)
         """
-        root = ET.fromstring(xml_string)
-        return self._parse_tree(root)
+        data = xml_string.encode("utf-8")
+        key = hashlib.blake2b(data, digest_size=16).digest()
+
+        cached = self._parse_cache.get(key)
+        if cached is not None:
+            self._parse_cache.move_to_end(key)
+            return list(cached)
+
+        elements = self._parse_stream(io.BytesIO(data))
+        self._parse_cache[key] = elements
+        if len(self._parse_cache) > self.PARSE_CACHE_SIZE:
+            self._parse_cache.popitem(last=False)
+        return list(elements)
+
+    def _parse_stream(self, source: Path | io.BytesIO) -> list[UIElement]:
+        """Parse XML incrementally without keeping the whole tree alive.
 
-    def _parse_tree(self, root: ET.Element) -> list[UIElement]:
-        """Parse element tree recursively.
+        Nodes are read on their start event, so elements come out in
+        document order (parents before children). Each node is cleared on
+        its end event, once its subtree has been parsed.
 
         Args:
-            root: Root element
+            source: XML file path or binary stream
 
         Returns:
             Flat list of all elements
         """
         elements: list[UIElement] = []
-        self._parse_node(root, elements)
+        for event, node in ET.iterparse(source, events=("start", "end")):
+            if event == "start":
+                element = self._parse_node(node)
+                if element is not None:
+                    elements.append(element)
+            else:
+                node.clear()
         return elements
 
-    def _parse_node(self, node: ET.Element, elements: list[UIElement]) -> None:
-        """Parse single node and its children.
+    def _parse_node(self, node: ET.Element) -> UIElement | None:
+        """Parse a single node's attributes.
 
         Args:
             node: Current XML node
-            elements: List to append elements to
+
+        Returns:
+            UIElement, or None if the node has no valid bounds
         """
         # Parse bounds: [left,top][right,bottom]
         bounds_str = node.get("bounds", "[0,0][0,0]")
         bounds = self._parse_bounds(bounds_str)
 
-        element = UIElement(
-            class_name=node.get("class", ""),
+        # Only keep elements with valid bounds
+        if bounds == (0, 0, 0, 0):
+            return None
+
+        # Class names and resource IDs repeat across a dump; intern them
+        resource_id = node.get("resource-id")
+        return UIElement(
+            class_name=sys.intern(node.get("class", "")),
             text=node.get("text") or None,
-            resource_id=node.get("resource-id") or None,
+            resource_id=sys.intern(resource_id) if resource_id else None,
             content_desc=node.get("content-desc") or None,
             bounds=bounds,
             clickable=node.get("clickable", "false") == "true",
@@ -92,14 +139,6 @@ class UIElementParser:
             index=int(node.get("index", 0)),
         )
 
-        # Only add elements with valid bounds
-        if bounds != (0, 0, 0, 0):
-            elements.append(element)
-
-        # Parse children
-        for child in node:
-            self._parse_node(child, elements)
-
     def _parse_bounds(self, bounds_str: str) -> tuple[int, int, int, int]:
         """Parse bounds string to tuple.
 
@@ -109,7 +148,7 @@ class UIElementParser:
         Returns:
             Tuple of (left, top, right, bottom)
         """
-        match = re.match(r"\[(\d+),(\d+)\]\[(\d+),(\d+)\]", bounds_str)
+        match = BOUNDS_PATTERN.match(bounds_str)
         if match:
             left, top, right, bottom = match.groups()
             return (int(left), int(top), int(right), int(bottom))
@@ -131,12 +170,16 @@ class UIElementParser:
         Returns:
             Smallest element containing point, or None
         """
-        matching = [e for e in elements if e.contains_point(x, y)]
-        if not matching:
-            return None
-
-        # Return smallest element (most specific)
-        return min(matching, key=lambda e: e.area())
+        # Single pass: keep the smallest (most specific) element seen so far
+        best: UIElement | None = None
+        best_area = 0
+        for element in elements:
+            if element.contains_point(x, y):
+                area = element.area()
+                if best is None or area < best_area:
+                    best = element
+                    best_area = area
+        return best
 
     def get_element_context(self, element: UIElement) -> dict:
         """Build context dict for AI prompt enrichment.
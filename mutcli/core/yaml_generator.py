@@ -9,6 +9,11 @@ from mutcli.core.step_analyzer import AnalyzedStep
 from mutcli.core.typing_detector import TypingSequence
 from mutcli.core.verification_suggester import VerificationPoint
 
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper  # type: ignore[assignment]
+
 
 class YAMLGenerator:
     """Generate YAML test files from recorded actions.
@@ -215,11 +220,11 @@ class YAMLGenerator:
         else:
             self._teardown.append("terminate_app")
 
-    def generate(self) -> str:
-        """Generate YAML content as string.
+    def _build_document(self) -> dict[str, Any]:
+        """Build the document that generate() serializes.
 
         Returns:
-            YAML formatted string with config, setup, steps, and teardown sections.
+            Dict with config, setup, steps, and teardown keys in output order.
             Empty sections (except steps) are omitted.
         """
         # Build document preserving key order
@@ -237,7 +242,22 @@ class YAMLGenerator:
         if self._teardown:
             doc["teardown"] = self._teardown
 
-        return yaml.dump(doc, default_flow_style=False, sort_keys=False, allow_unicode=True)
+        return doc
+
+    def generate(self) -> str:
+        """Generate YAML content as string.
+
+        Returns:
+            YAML formatted string with config, setup, steps, and teardown sections.
+            Empty sections (except steps) are omitted.
+        """
+        return yaml.dump(
+            self._build_document(),
+            Dumper=SafeDumper,
+            default_flow_style=False,
+            sort_keys=False,
+            allow_unicode=True,
+        )
 
     def save(self, path: Path | str) -> None:
         """Save YAML to file.
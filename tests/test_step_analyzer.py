@@ -52,6 +52,12 @@ class TestAnalyzedStep:
         assert step.index == 2
         assert step.scroll_to_target == "Settings"
 
+    def test_uses_slots(self):
+        """AnalyzedStep should not carry a per-instance __dict__."""
+        step = AnalyzedStep(index=0, original_tap={}, element_text=None)
+
+        assert not hasattr(step, "__dict__")
+
     def test_creation_with_none_element_text(self):
         """AnalyzedStep should allow None element_text."""
         step = AnalyzedStep(
@@ -1,7 +1,10 @@
 """Tests for TouchMonitor."""
 
 import time
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
 
 from mutcli.core.touch_monitor import TouchEvent, TouchMonitor, TrajectoryPoint
 
@@ -31,6 +34,37 @@ def make_event(
     )
 
 
+def fake_process(lines=()):
+    """Lightweight stand-in for the getevent Popen object."""
+    return SimpleNamespace(stdout=iter(lines), terminate=Mock())
+
+
+@pytest.fixture
+def getevent_mocks():
+    """Patch device access so TouchMonitor.start() runs without adb.
+
+    The mocked getevent process has empty stdout; set ``process.stdout``
+    before calling start() to feed lines to the reader thread.
+    """
+    with patch("subprocess.Popen") as mock_popen, \
+         patch.object(TouchMonitor, "_get_device_info", return_value=True), \
+         patch("mutcli.core.touch_monitor.ADBStateMonitor") as mock_adb_monitor_class:
+        mock_process = fake_process()
+        mock_popen.return_value = mock_process
+
+        yield SimpleNamespace(
+            popen=mock_popen,
+            process=mock_process,
+            adb_monitor_class=mock_adb_monitor_class,
+        )
+
+
+def wait_for_reader(monitor):
+    """Block until the reader thread has consumed all mocked getevent output."""
+    if monitor._thread:
+        monitor._thread.join(timeout=1)
+
+
 class TestTouchEvent:
     """Test TouchEvent dataclass."""
 
@@ -128,35 +162,26 @@ class TestTouchMonitorInitialization:
 class TestTouchMonitorStart:
     """Test TouchMonitor start/stop."""
 
-    def test_start_launches_adb_getevent(self):
+    def test_start_launches_adb_getevent(self, getevent_mocks):
         """start() should launch adb getevent subprocess."""
-        with patch("subprocess.Popen") as mock_popen, \
-             patch.object(TouchMonitor, "_get_device_info", return_value=True), \
-             patch("mutcli.core.touch_monitor.ADBStateMonitor"):
-            mock_process = MagicMock()
-            mock_process.stdout = iter([])  # Empty iterator
-            mock_popen.return_value = mock_process
-
-            monitor = TouchMonitor("test-device")
-            result = monitor.start()
-
-            # Give thread time to start
-            time.sleep(0.1)
+        monitor = TouchMonitor("test-device")
+        result = monitor.start()
+        wait_for_reader(monitor)
 
-            assert result is True
-            assert monitor.is_running is True
+        assert result is True
+        assert monitor.is_running is True
 
-            mock_popen.assert_called_once()
-            call_args = mock_popen.call_args
-            cmd = call_args[0][0]
+        getevent_mocks.popen.assert_called_once()
+        call_args = getevent_mocks.popen.call_args
+        cmd = call_args[0][0]
 
-            assert "adb" in cmd
-            assert "-s" in cmd
-            assert "test-device" in cmd
-            assert "getevent" in cmd
-            assert "-lt" in cmd
+        assert "adb" in cmd
+        assert "-s" in cmd
+        assert "test-device" in cmd
+        assert "getevent" in cmd
+        assert "-lt" in cmd
 
-            monitor.stop()
+        monitor.stop()
 
     def test_start_returns_false_on_device_info_failure(self):
         """start() should return False if device info fails."""
@@ -167,53 +192,37 @@ class TestTouchMonitorStart:
             assert result is False
             assert monitor.is_running is False
 
-    def test_start_returns_false_on_process_error(self):
+    def test_start_returns_false_on_process_error(self, getevent_mocks):
         """start() should return False if subprocess fails."""
-        with patch("subprocess.Popen") as mock_popen, \
-             patch.object(TouchMonitor, "_get_device_info", return_value=True):
-            mock_popen.side_effect = OSError("adb not found")
+        getevent_mocks.popen.side_effect = OSError("adb not found")
 
-            monitor = TouchMonitor("test-device")
-            result = monitor.start()
+        monitor = TouchMonitor("test-device")
+        result = monitor.start()
 
-            assert result is False
-            assert monitor.is_running is False
+        assert result is False
+        assert monitor.is_running is False
 
-    def test_stop_clears_running_state(self):
+    def test_stop_clears_running_state(self, getevent_mocks):
         """stop() should set is_running to False."""
-        with patch("subprocess.Popen") as mock_popen, \
-             patch.object(TouchMonitor, "_get_device_info", return_value=True), \
-             patch("mutcli.core.touch_monitor.ADBStateMonitor"):
-            mock_process = MagicMock()
-            mock_process.stdout = iter([])
-            mock_popen.return_value = mock_process
-
-            monitor = TouchMonitor("test-device")
-            monitor.start()
-            time.sleep(0.1)
+        monitor = TouchMonitor("test-device")
+        monitor.start()
+        wait_for_reader(monitor)
 
-            assert monitor.is_running is True
+        assert monitor.is_running is True
 
-            monitor.stop()
+        monitor.stop()
 
-            assert monitor.is_running is False
+        assert monitor.is_running is False
 
-    def test_stop_terminates_process(self):
+    def test_stop_terminates_process(self, getevent_mocks):
         """stop() should terminate the subprocess."""
-        with patch("subprocess.Popen") as mock_popen, \
-             patch.object(TouchMonitor, "_get_device_info", return_value=True), \
-             patch("mutcli.core.touch_monitor.ADBStateMonitor"):
-            mock_process = MagicMock()
-            mock_process.stdout = iter([])
-            mock_popen.return_value = mock_process
-
-            monitor = TouchMonitor("test-device")
-            monitor.start()
-            time.sleep(0.1)
+        monitor = TouchMonitor("test-device")
+        monitor.start()
+        wait_for_reader(monitor)
 
-            monitor.stop()
+        monitor.stop()
 
-            mock_process.terminate.assert_called()
+        getevent_mocks.process.terminate.assert_called()
 
     def test_stop_when_not_running(self):
         """stop() should be safe to call when not running."""
@@ -423,7 +432,7 @@ class TestCoordinateConversion:
 class TestTouchMonitorEventParsing:
     """Test getevent line parsing."""
 
-    def test_ignores_non_touch_events(self):
+    def test_ignores_non_touch_events(self, getevent_mocks):
         """Should ignore non-touch events."""
         getevent_lines = [
             "[   123.456789] /dev/input/event5: EV_KEY KEY_VOLUMEDOWN DOWN",
@@ -431,21 +440,47 @@ class TestTouchMonitorEventParsing:
             "[   123.556789] /dev/input/event5: EV_KEY KEY_VOLUMEDOWN UP",
         ]
 
-        with patch("subprocess.Popen") as mock_popen, \
-             patch.object(TouchMonitor, "_get_device_info", return_value=True), \
-             patch("mutcli.core.touch_monitor.ADBStateMonitor"):
-            mock_process = MagicMock()
-            mock_process.stdout = iter(getevent_lines)
-            mock_popen.return_value = mock_process
+        getevent_mocks.process.stdout = iter(getevent_lines)
 
-            monitor = TouchMonitor("test-device")
-            monitor.start()
-            time.sleep(0.2)
-            monitor.stop()
+        monitor = TouchMonitor("test-device")
+        monitor.start()
+        wait_for_reader(monitor)
+        monitor.stop()
+
+        events = monitor.get_events()
 
-            events = monitor.get_events()
+        assert len(events) == 0
 
-            assert len(events) == 0
+    def test_parse_line_updates_position(self):
+        """_parse_line should decode ABS_MT_POSITION values from hex."""
+        monitor = TouchMonitor("test-device")
+
+        monitor._parse_line("[   123.456789] /dev/input/event5: EV_ABS ABS_MT_POSITION_X 00000219")
+        monitor._parse_line("[   123.456790] /dev/input/event5: EV_ABS ABS_MT_POSITION_Y 000004b0")
+        monitor._parse_line("[   123.456791] /dev/input/event5: EV_SYN SYN_REPORT 00000000")
+
+        assert monitor._current_x == 0x219
+        assert monitor._current_y == 0x4B0
+
+    def test_parse_line_records_gesture_from_btn_touch(self):
+        """BTN_TOUCH DOWN/UP lines must pass the fast-reject filter and record a tap."""
+        monitor = TouchMonitor("test-device")
+        monitor._start_time = time.time()
+
+        for line in [
+            "[   123.456789] /dev/input/event5: EV_KEY BTN_TOUCH DOWN",
+            "[   123.456790] /dev/input/event5: EV_ABS ABS_MT_POSITION_X 00000219",
+            "[   123.456791] /dev/input/event5: EV_ABS ABS_MT_POSITION_Y 000004b0",
+            "[   123.456792] /dev/input/event5: EV_SYN SYN_REPORT 00000000",
+            "[   123.556789] /dev/input/event5: EV_KEY BTN_TOUCH UP",
+        ]:
+            monitor._parse_line(line)
+
+        events = monitor.get_events()
+
+        assert len(events) == 1
+        assert (events[0].x, events[0].y) == (0x219, 0x4B0)
+        assert events[0].gesture == "tap"
 
 
 class TestTouchMonitorClearEvents:
@@ -559,47 +594,32 @@ class TestTouchMonitorADBStateIntegration:
         assert isinstance(state, dict)
         assert state == {}
 
-    def test_start_creates_adb_state_monitor(self):
+    def test_start_creates_adb_state_monitor(self, getevent_mocks):
         """start() should create and start ADB state monitor."""
-        with patch("subprocess.Popen") as mock_popen, \
-             patch.object(TouchMonitor, "_get_device_info", return_value=True), \
-             patch("mutcli.core.touch_monitor.ADBStateMonitor") as mock_adb_monitor_class:
-            mock_process = MagicMock()
-            mock_process.stdout = iter([])
-            mock_popen.return_value = mock_process
-
-            mock_adb_monitor = MagicMock()
-            mock_adb_monitor_class.return_value = mock_adb_monitor
+        mock_adb_monitor_class = getevent_mocks.adb_monitor_class
+        mock_adb_monitor = mock_adb_monitor_class.return_value
 
-            monitor = TouchMonitor("test-device")
-            monitor.start()
-            time.sleep(0.1)
+        monitor = TouchMonitor("test-device")
+        monitor.start()
+        wait_for_reader(monitor)
 
-            # Verify ADB state monitor was created and started
-            mock_adb_monitor_class.assert_called_once_with("test-device")
-            mock_adb_monitor.start.assert_called_once()
+        # Verify ADB state monitor was created and started
+        mock_adb_monitor_class.assert_called_once_with("test-device")
+        mock_adb_monitor.start.assert_called_once()
 
-            monitor.stop()
+        monitor.stop()
 
-    def test_stop_stops_adb_state_monitor(self):
+    def test_stop_stops_adb_state_monitor(self, getevent_mocks):
         """stop() should stop ADB state monitor."""
-        with patch("subprocess.Popen") as mock_popen, \
-             patch.object(TouchMonitor, "_get_device_info", return_value=True), \
-             patch("mutcli.core.touch_monitor.ADBStateMonitor") as mock_adb_monitor_class:
-            mock_process = MagicMock()
-            mock_process.stdout = iter([])
-            mock_popen.return_value = mock_process
-
-            mock_adb_monitor = MagicMock()
-            mock_adb_monitor_class.return_value = mock_adb_monitor
+        mock_adb_monitor = getevent_mocks.adb_monitor_class.return_value
 
-            monitor = TouchMonitor("test-device")
-            monitor.start()
-            time.sleep(0.1)
-            monitor.stop()
+        monitor = TouchMonitor("test-device")
+        monitor.start()
+        wait_for_reader(monitor)
+        monitor.stop()
 
-            # Verify ADB state monitor was stopped
-            mock_adb_monitor.stop.assert_called_once()
+        # Verify ADB state monitor was stopped
+        mock_adb_monitor.stop.assert_called_once()
 
     def test_get_adb_state_at_delegates_to_monitor(self):
         """get_adb_state_at should delegate to ADB state monitor."""
@@ -1,9 +1,39 @@
 """Tests for TypingDetector."""
 
+import numpy as np
 import pytest
 
 from mutcli.core.typing_detector import TypingDetector, TypingSequence
 
+# Shared read-only event pools (tuples: detect() never mutates its input)
+KEYBOARD_TAPS = (
+    {"x": 200, "y": 1800, "timestamp": 0.0},
+    {"x": 300, "y": 1850, "timestamp": 0.3},
+    {"x": 250, "y": 1900, "timestamp": 0.6},
+)
+
+TYPING_BETWEEN_TAPS = (
+    {"x": 100, "y": 500, "timestamp": 0.0},    # Non-keyboard tap
+    {"x": 200, "y": 1800, "timestamp": 1.0},   # Keyboard tap 1
+    {"x": 300, "y": 1850, "timestamp": 1.3},   # Keyboard tap 2
+    {"x": 250, "y": 1900, "timestamp": 1.6},   # Keyboard tap 3
+    {"x": 280, "y": 1820, "timestamp": 1.9},   # Keyboard tap 4
+    {"x": 400, "y": 600, "timestamp": 2.5},    # Non-keyboard tap
+)
+
+# Touch events in bottom 40% of screen
+BOTTOM_AREA_TAPS = (
+    {"x": 500, "y": 2000, "timestamp": 0.0},
+    {"x": 500, "y": 2000, "timestamp": 0.2},
+    {"x": 500, "y": 2000, "timestamp": 0.4},
+)
+
+
+@pytest.fixture(scope="module")
+def detector():
+    """Shared heuristic-only detector for a 2400px tall screen (stateless)."""
+    return TypingDetector(screen_height=2400)
+
 
 class TestTypingSequence:
     """Test TypingSequence dataclass."""
@@ -55,64 +85,48 @@ class TestTypingDetectorInitialization:
 class TestIsKeyboardTap:
     """Test is_keyboard_tap method."""
 
-    def test_tap_in_keyboard_area_returns_true(self):
-        """Tap in bottom 40% should return True."""
-        detector = TypingDetector(screen_height=2400)
-        # Keyboard area: y > 1440 (60% of 2400)
-
-        assert detector.is_keyboard_tap(1800) is True
-        assert detector.is_keyboard_tap(2400) is True
-        assert detector.is_keyboard_tap(1441) is True
-
-    def test_tap_outside_keyboard_area_returns_false(self):
-        """Tap outside bottom 40% should return False."""
-        detector = TypingDetector(screen_height=2400)
-        # Non-keyboard area: y <= 1440
-
-        assert detector.is_keyboard_tap(500) is False
-        assert detector.is_keyboard_tap(1200) is False
-        assert detector.is_keyboard_tap(1440) is False
-
-    def test_tap_at_boundary(self):
-        """Tap exactly at boundary should return False."""
-        detector = TypingDetector(screen_height=2400)
-        # Boundary is at y = 1440 (60% of 2400)
-
-        # At boundary - should be False (keyboard area is y > threshold)
-        assert detector.is_keyboard_tap(1440) is False
-
-    def test_different_screen_heights(self):
+    @pytest.mark.parametrize(
+        "y, expected",
+        [
+            # Keyboard area: y > 1440 (60% of 2400)
+            (1800, True),
+            (2400, True),
+            (1441, True),
+            # Non-keyboard area: y <= 1440
+            (500, False),
+            (1200, False),
+            # At boundary - keyboard area is y > threshold
+            (1440, False),
+        ],
+    )
+    def test_bottom_40_percent_is_keyboard_area(self, detector, y, expected):
+        """Taps in the bottom 40% are keyboard taps; the boundary itself is not."""
+        assert detector.is_keyboard_tap(y) is expected
+
+    @pytest.mark.parametrize(
+        "screen_height, y, expected",
+        [
+            # Screen height 1000: keyboard area y > 600
+            (1000, 601, True),
+            (1000, 600, False),
+            # Screen height 1920: keyboard area y > 1152
+            (1920, 1153, True),
+            (1920, 1152, False),
+        ],
+    )
+    def test_different_screen_heights(self, screen_height, y, expected):
         """Should work with different screen heights."""
-        # Screen height 1000: keyboard area y > 600
-        detector = TypingDetector(screen_height=1000)
-
-        assert detector.is_keyboard_tap(601) is True
-        assert detector.is_keyboard_tap(600) is False
+        detector = TypingDetector(screen_height=screen_height)
 
-        # Screen height 1920: keyboard area y > 1152
-        detector2 = TypingDetector(screen_height=1920)
-
-        assert detector2.is_keyboard_tap(1153) is True
-        assert detector2.is_keyboard_tap(1152) is False
+        assert detector.is_keyboard_tap(y) is expected
 
 
 class TestDetectTypingSequences:
     """Test detect method for finding typing sequences."""
 
-    def test_detects_typing_in_bottom_40_percent(self):
+    def test_detects_typing_in_bottom_40_percent(self, detector):
         """Should detect typing when taps are in keyboard area."""
-        detector = TypingDetector(screen_height=2400)
-
-        touch_events = [
-            {"x": 100, "y": 500, "timestamp": 0.0},    # Non-keyboard tap
-            {"x": 200, "y": 1800, "timestamp": 1.0},   # Keyboard tap 1
-            {"x": 300, "y": 1850, "timestamp": 1.3},   # Keyboard tap 2
-            {"x": 250, "y": 1900, "timestamp": 1.6},   # Keyboard tap 3
-            {"x": 280, "y": 1820, "timestamp": 1.9},   # Keyboard tap 4
-            {"x": 400, "y": 600, "timestamp": 2.5},    # Non-keyboard tap
-        ]
-
-        sequences = detector.detect(touch_events)
+        sequences = detector.detect(TYPING_BETWEEN_TAPS)
 
         assert len(sequences) == 1
         seq = sequences[0]
@@ -121,10 +135,8 @@ class TestDetectTypingSequences:
         assert seq.tap_count == 4
         assert seq.duration == pytest.approx(0.9, abs=0.01)
 
-    def test_requires_minimum_3_consecutive_keyboard_taps(self):
+    def test_requires_minimum_3_consecutive_keyboard_taps(self, detector):
         """Should not detect sequence with less than 3 keyboard taps."""
-        detector = TypingDetector(screen_height=2400)
-
         # Only 2 keyboard taps
         touch_events = [
             {"x": 100, "y": 500, "timestamp": 0.0},    # Non-keyboard
@@ -137,10 +149,8 @@ class TestDetectTypingSequences:
 
         assert len(sequences) == 0
 
-    def test_splits_sequences_on_time_gap(self):
+    def test_splits_sequences_on_time_gap(self, detector):
         """Should split sequences when gap > 1s between taps."""
-        detector = TypingDetector(screen_height=2400)
-
         touch_events = [
             # First sequence
             {"x": 200, "y": 1800, "timestamp": 0.0},
@@ -163,10 +173,8 @@ class TestDetectTypingSequences:
         assert sequences[1].end_index == 5
         assert sequences[1].tap_count == 3
 
-    def test_ends_sequence_on_non_keyboard_tap(self):
+    def test_ends_sequence_on_non_keyboard_tap(self, detector):
         """Should end sequence when non-keyboard tap occurs."""
-        detector = TypingDetector(screen_height=2400)
-
         touch_events = [
             {"x": 200, "y": 1800, "timestamp": 0.0},   # Keyboard
             {"x": 300, "y": 1850, "timestamp": 0.3},   # Keyboard
@@ -184,10 +192,8 @@ class TestDetectTypingSequences:
         assert sequences[0].end_index == 2
         assert sequences[0].tap_count == 3
 
-    def test_returns_empty_list_when_no_typing(self):
+    def test_returns_empty_list_when_no_typing(self, detector):
         """Should return empty list when no typing detected."""
-        detector = TypingDetector(screen_height=2400)
-
         # All taps outside keyboard area
         touch_events = [
             {"x": 100, "y": 500, "timestamp": 0.0},
@@ -199,18 +205,14 @@ class TestDetectTypingSequences:
 
         assert sequences == []
 
-    def test_handles_empty_touch_events(self):
+    def test_handles_empty_touch_events(self, detector):
         """Should handle empty touch events list."""
-        detector = TypingDetector(screen_height=2400)
-
         sequences = detector.detect([])
 
         assert sequences == []
 
-    def test_handles_single_tap(self):
+    def test_handles_single_tap(self, detector):
         """Should handle single tap (no sequence possible)."""
-        detector = TypingDetector(screen_height=2400)
-
         touch_events = [
             {"x": 200, "y": 1800, "timestamp": 0.0},
         ]
@@ -219,10 +221,8 @@ class TestDetectTypingSequences:
 
         assert sequences == []
 
-    def test_detects_multiple_separate_sequences(self):
+    def test_detects_multiple_separate_sequences(self, detector):
         """Should detect multiple separate typing sequences."""
-        detector = TypingDetector(screen_height=2400)
-
         touch_events = [
             # First typing sequence
             {"x": 200, "y": 1800, "timestamp": 0.0},
@@ -249,25 +249,15 @@ class TestDetectTypingSequences:
         assert sequences[1].end_index == 7
         assert sequences[1].tap_count == 4
 
-    def test_text_field_is_none_by_default(self):
+    def test_text_field_is_none_by_default(self, detector):
         """Detected sequences should have text=None."""
-        detector = TypingDetector(screen_height=2400)
-
-        touch_events = [
-            {"x": 200, "y": 1800, "timestamp": 0.0},
-            {"x": 300, "y": 1850, "timestamp": 0.3},
-            {"x": 250, "y": 1900, "timestamp": 0.6},
-        ]
-
-        sequences = detector.detect(touch_events)
+        sequences = detector.detect(KEYBOARD_TAPS)
 
         assert len(sequences) == 1
         assert sequences[0].text is None
 
-    def test_sequence_at_end_of_events(self):
+    def test_sequence_at_end_of_events(self, detector):
         """Should detect sequence that ends at last event."""
-        detector = TypingDetector(screen_height=2400)
-
         touch_events = [
             {"x": 100, "y": 500, "timestamp": 0.0},    # Non-keyboard
             {"x": 200, "y": 1800, "timestamp": 1.0},   # Keyboard
@@ -282,10 +272,8 @@ class TestDetectTypingSequences:
         assert sequences[0].end_index == 3
         assert sequences[0].tap_count == 3
 
-    def test_all_events_are_keyboard_taps(self):
+    def test_all_events_are_keyboard_taps(self, detector):
         """Should detect when all events are keyboard taps."""
-        detector = TypingDetector(screen_height=2400)
-
         touch_events = [
             {"x": 200, "y": 1800, "timestamp": 0.0},
             {"x": 300, "y": 1850, "timestamp": 0.3},
@@ -300,10 +288,8 @@ class TestDetectTypingSequences:
         assert sequences[0].end_index == 3
         assert sequences[0].tap_count == 4
 
-    def test_gap_exactly_at_threshold(self):
+    def test_gap_exactly_at_threshold(self, detector):
         """Gap exactly at 1.0s should still be part of same sequence."""
-        detector = TypingDetector(screen_height=2400)
-
         touch_events = [
             {"x": 200, "y": 1800, "timestamp": 0.0},
             {"x": 300, "y": 1850, "timestamp": 1.0},   # Exactly 1s gap
@@ -315,10 +301,8 @@ class TestDetectTypingSequences:
         assert len(sequences) == 1
         assert sequences[0].tap_count == 3
 
-    def test_gap_just_over_threshold(self):
+    def test_gap_just_over_threshold(self, detector):
         """Gap just over 1.0s should split sequences."""
-        detector = TypingDetector(screen_height=2400)
-
         touch_events = [
             {"x": 200, "y": 1800, "timestamp": 0.0},
             {"x": 300, "y": 1850, "timestamp": 0.5},
@@ -332,6 +316,35 @@ class TestDetectTypingSequences:
 
         assert len(sequences) == 2
 
+    def test_fractional_y_just_above_boundary(self, detector):
+        """Non-integer y just above the keyboard boundary should count as keyboard."""
+        # Boundary is 1440.0 on a 2400px screen; truncating 1440.6 would miss it
+        touch_events = [
+            {"x": 200, "y": 1440.6, "timestamp": 0.0},
+            {"x": 300, "y": 1440.6, "timestamp": 0.3},
+            {"x": 250, "y": 1440.6, "timestamp": 0.6},
+        ]
+
+        sequences = detector.detect(touch_events)
+
+        assert len(sequences) == 1
+        assert sequences[0].tap_count == 3
+
+
+class TestDetectArrays:
+    """Test detect_arrays entry point for array-based touch data."""
+
+    def test_matches_detect(self, detector):
+        """detect_arrays should find the same sequences as detect."""
+        ys = np.array([e["y"] for e in TYPING_BETWEEN_TAPS])
+        timestamps = np.array([e["timestamp"] for e in TYPING_BETWEEN_TAPS])
+
+        assert detector.detect_arrays(ys, timestamps) == detector.detect(TYPING_BETWEEN_TAPS)
+
+    def test_empty_arrays(self, detector):
+        """detect_arrays should handle empty input."""
+        assert detector.detect_arrays(np.array([]), np.array([])) == []
+
 
 class TestKeyboardStatesIntegration:
     """Test keyboard visibility states from ADB monitoring."""
@@ -368,14 +381,7 @@ class TestKeyboardStatesIntegration:
         # No keyboard states provided
         detector = TypingDetector(screen_height=2400, keyboard_states=None)
 
-        # Touch events in bottom 40% of screen
-        touch_events = [
-            {"x": 500, "y": 2000, "timestamp": 0.0},
-            {"x": 500, "y": 2000, "timestamp": 0.2},
-            {"x": 500, "y": 2000, "timestamp": 0.4},
-        ]
-
-        sequences = detector.detect(touch_events)
+        sequences = detector.detect(BOTTOM_AREA_TAPS)
 
         # Should use heuristics (bottom 40% = keyboard area)
         assert len(sequences) == 1
@@ -384,14 +390,7 @@ class TestKeyboardStatesIntegration:
         """Test that empty keyboard_states list still uses heuristics."""
         detector = TypingDetector(screen_height=2400, keyboard_states=[])
 
-        # Touch events in bottom 40% of screen
-        touch_events = [
-            {"x": 500, "y": 2000, "timestamp": 0.0},
-            {"x": 500, "y": 2000, "timestamp": 0.2},
-            {"x": 500, "y": 2000, "timestamp": 0.4},
-        ]
-
-        sequences = detector.detect(touch_events)
+        sequences = detector.detect(BOTTOM_AREA_TAPS)
 
         # Should fall back to heuristics since no keyboard state data
         assert len(sequences) == 1
@@ -489,6 +488,36 @@ class TestKeyboardStatesIntegration:
         assert detector._is_keyboard_visible_at(4.0) is False
         assert detector._is_keyboard_visible_at(5.0) is False
 
+    def test_is_keyboard_visible_at_before_first_state(self):
+        """Test _is_keyboard_visible_at returns None before the first recorded state."""
+        keyboard_states = [
+            (1.0, True),
+            (2.0, False),
+        ]
+
+        detector = TypingDetector(screen_height=2400, keyboard_states=keyboard_states)
+
+        assert detector._is_keyboard_visible_at(0.5) is None
+        assert detector._is_keyboard_visible_at(1.0) is True
+
+    def test_keyboard_mask_prefers_keyboard_states(self):
+        """Test _keyboard_mask uses ADB state, falling back to heuristics before it."""
+        keyboard_states = [
+            (1.0, True),
+            (2.0, False),
+        ]
+
+        detector = TypingDetector(screen_height=2400, keyboard_states=keyboard_states)
+
+        ys = np.array([2000, 1000, 2000])
+        timestamps = np.array([
+            0.5,  # no state yet - heuristic
+            1.5,  # keyboard visible
+            2.5,  # keyboard hidden
+        ])
+
+        assert detector._keyboard_mask(ys, timestamps).tolist() == [True, True, False]
+
     def test_stores_keyboard_states(self):
         """Should store keyboard states for later use."""
         keyboard_states = [
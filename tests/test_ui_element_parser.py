@@ -1,12 +1,10 @@
 """Tests for UI element parser."""
 
-from mutcli.core.ui_element_parser import UIElementParser
-
+import pytest
 
-class TestUIElementParser:
-    """Tests for UI element parsing from uiautomator dumps."""
+from mutcli.core.ui_element_parser import UIElementParser
 
-    SAMPLE_XML = '''<?xml version="1.0" encoding="UTF-8"?>
+SAMPLE_XML = '''<?xml version="1.0" encoding="UTF-8"?>
 <hierarchy rotation="0">
   <node index="0" class="android.widget.FrameLayout" bounds="[0,0][1080,2400]">
     <node index="0" class="android.widget.Button" text="Sign In"
@@ -18,38 +16,83 @@ class TestUIElementParser:
   </node>
 </hierarchy>'''
 
-    def test_parse_xml(self):
+
+@pytest.fixture(scope="module")
+def parser():
+    """Shared parser; its parse cache persists across this module's tests."""
+    return UIElementParser()
+
+
+@pytest.fixture(scope="module")
+def elements(parser):
+    """SAMPLE_XML parsed once per module; tests must not mutate it."""
+    return parser.parse_xml_string(SAMPLE_XML)
+
+
+class TestUIElementParser:
+    """Tests for UI element parsing from uiautomator dumps."""
+
+    def test_parse_xml(self, elements):
         """Test parsing XML to elements."""
-        parser = UIElementParser()
-        elements = parser.parse_xml_string(self.SAMPLE_XML)
         assert len(elements) == 3  # FrameLayout, Button, EditText
 
-    def test_find_element_at_coordinates(self):
+    def test_find_element_at_coordinates(self, parser, elements):
         """Test finding element at tap coordinates."""
-        parser = UIElementParser()
-        elements = parser.parse_xml_string(self.SAMPLE_XML)
-
         # Find button at (200, 550)
         element = parser.find_element_at(elements, 200, 550)
         assert element is not None
         assert element.text == "Sign In"
         assert element.resource_id == "com.example:id/btn_login"
 
-    def test_find_element_at_coordinates_not_found(self):
+    def test_find_element_at_coordinates_not_found(self, parser, elements):
         """Test when no element at coordinates."""
-        parser = UIElementParser()
-        elements = parser.parse_xml_string(self.SAMPLE_XML)
-
         # Find at coordinates outside any element
         element = parser.find_element_at(elements, 1000, 1000)
         # Should return closest parent or None
         assert element is None or element.class_name == "android.widget.FrameLayout"
 
-    def test_element_properties(self):
-        """Test UIElement properties."""
+    def test_find_element_at_prefers_earliest_on_equal_area(self, parser):
+        """Test ties between same-sized elements go to the first in document order."""
+        xml = SAMPLE_XML.replace("[100,300][980,400]", "[100,500][300,600]")
+        overlapping = parser.parse_xml_string(xml)
+
+        element = parser.find_element_at(overlapping, 200, 550)
+
+        assert element is not None
+        assert element.text == "Sign In"
+
+    def test_parse_xml_string_is_memoized(self):
+        """Test repeated parses of the same dump reuse cached elements."""
         parser = UIElementParser()
-        elements = parser.parse_xml_string(self.SAMPLE_XML)
 
+        first = parser.parse_xml_string(SAMPLE_XML)
+        second = parser.parse_xml_string(SAMPLE_XML)
+
+        # New list each call so callers can't corrupt the cache
+        assert first is not second
+        assert all(a is b for a, b in zip(first, second, strict=True))
+
+    def test_parse_cache_is_bounded(self):
+        """Test the parse cache evicts the least recently used dump."""
+        parser = UIElementParser()
+        dumps = [
+            SAMPLE_XML.replace("Sign In", f"Sign In {i}")
+            for i in range(UIElementParser.PARSE_CACHE_SIZE + 1)
+        ]
+        first_parse = [parser.parse_xml_string(xml) for xml in dumps[:-1]]
+
+        # Re-read the oldest dump, then overflow: dumps[1] is now least recent
+        parser.parse_xml_string(dumps[0])
+        parser.parse_xml_string(dumps[-1])
+
+        assert len(parser._parse_cache) == UIElementParser.PARSE_CACHE_SIZE
+        # Recently re-read dump is still cached: same element objects
+        assert parser.parse_xml_string(dumps[0])[0] is first_parse[0][0]
+        # Evicted dump is parsed again into new element objects
+        assert parser.parse_xml_string(dumps[1])[0] is not first_parse[1][0]
+
+    def test_element_properties(self, elements):
+        """Test UIElement properties."""
         # Find email input
         email_input = next(
             (e for e in elements if "email_input" in (e.resource_id or "")),
@@ -1,11 +1,45 @@
 """Tests for VerificationSuggester."""
 
-from unittest.mock import MagicMock
+import pytest
 
 from mutcli.core.step_analyzer import AnalyzedStep
 from mutcli.core.verification_suggester import VerificationPoint, VerificationSuggester
 
 
+class _StubAIAnalyzer:
+    """Stand-in for AIAnalyzer; suggest() never calls the analyzer."""
+
+
+def make_step(
+    index=0,
+    original_tap=None,
+    element_text=None,
+    before_description="",
+    after_description="",
+    suggested_verification=None,
+):
+    """Helper to create AnalyzedStep with defaults."""
+    return AnalyzedStep(
+        index=index,
+        original_tap=original_tap if original_tap is not None else {"x": 0, "y": 0},
+        element_text=element_text,
+        before_description=before_description,
+        after_description=after_description,
+        suggested_verification=suggested_verification,
+    )
+
+
+def by_step_index(suggestions):
+    """Map suggestions by the step index they follow."""
+    return {s.after_step_index: s for s in suggestions}
+
+
+@pytest.fixture(scope="module")
+def suggester():
+    """Shared suggester; suggest() keeps no state between calls."""
+    return VerificationSuggester(ai_analyzer=_StubAIAnalyzer())
+
+
 class TestVerificationPoint:
     """Test VerificationPoint dataclass."""
 
@@ -47,39 +81,34 @@ class TestVerificationSuggesterInitialization:
 
     def test_stores_ai_analyzer(self):
         """Should store AIAnalyzer instance."""
-        mock_ai = MagicMock()
+        stub_ai = _StubAIAnalyzer()
 
-        suggester = VerificationSuggester(ai_analyzer=mock_ai)
+        suggester = VerificationSuggester(ai_analyzer=stub_ai)
 
-        assert suggester._ai_analyzer is mock_ai
+        assert suggester._ai_analyzer is stub_ai
 
 
 class TestSuggestAfterFormSubmission:
     """Test verification suggestion after form submission."""
 
-    def test_suggests_verification_after_login_button(self):
+    def test_suggests_verification_after_login_button(self, suggester):
         """Should suggest verification after tapping 'Login' button."""
-        mock_ai = MagicMock()
-        suggester = VerificationSuggester(ai_analyzer=mock_ai)
-
         steps = [
-            AnalyzedStep(
+            make_step(
                 index=0,
                 original_tap={"x": 100, "y": 200, "timestamp": 0.0},
                 element_text="Email",
                 before_description="Login form displayed",
                 after_description="Email field focused",
-                suggested_verification=None,
             ),
-            AnalyzedStep(
+            make_step(
                 index=1,
                 original_tap={"x": 100, "y": 300, "timestamp": 1.0},
                 element_text="Password",
                 before_description="Email entered",
                 after_description="Password field focused",
-                suggested_verification=None,
             ),
-            AnalyzedStep(
+            make_step(
                 index=2,
                 original_tap={"x": 200, "y": 400, "timestamp": 2.0},
                 element_text="Login",
@@ -93,52 +122,22 @@ class TestSuggestAfterFormSubmission:
 
         # Should suggest verification after the Login button tap
         assert len(suggestions) >= 1
-        login_suggestion = next(
-            (s for s in suggestions if s.after_step_index == 2), None
-        )
+        login_suggestion = by_step_index(suggestions).get(2)
         assert login_suggestion is not None
         assert login_suggestion.confidence > 0.5
         reason_lower = login_suggestion.reason.lower()
         assert "form" in reason_lower or "login" in reason_lower
 
-    def test_suggests_verification_after_submit_button(self):
-        """Should suggest verification after tapping 'Submit' button."""
-        mock_ai = MagicMock()
-        suggester = VerificationSuggester(ai_analyzer=mock_ai)
-
+    @pytest.mark.parametrize("element_text", ["Login", "Submit", "Sign In"])
+    def test_suggests_verification_after_submission_button(self, suggester, element_text):
+        """Should suggest form-submission verification after tapping a submit-like button."""
         steps = [
-            AnalyzedStep(
+            make_step(
                 index=0,
                 original_tap={"x": 200, "y": 500, "timestamp": 0.0},
-                element_text="Submit",
+                element_text=element_text,
                 before_description="Form filled out",
                 after_description="Form submitted",
-                suggested_verification="Form submission successful",
-            ),
-        ]
-
-        suggestions = suggester.suggest(steps)
-
-        assert len(suggestions) >= 1
-        submit_suggestion = next(
-            (s for s in suggestions if s.after_step_index == 0), None
-        )
-        assert submit_suggestion is not None
-        assert submit_suggestion.confidence > 0.5
-
-    def test_suggests_verification_after_sign_in_button(self):
-        """Should suggest verification after tapping 'Sign In' button."""
-        mock_ai = MagicMock()
-        suggester = VerificationSuggester(ai_analyzer=mock_ai)
-
-        steps = [
-            AnalyzedStep(
-                index=0,
-                original_tap={"x": 200, "y": 500, "timestamp": 0.0},
-                element_text="Sign In",
-                before_description="Login screen",
-                after_description="Dashboard displayed",
-                suggested_verification=None,
             ),
         ]
 
@@ -146,24 +145,22 @@ class TestSuggestAfterFormSubmission:
 
         assert len(suggestions) >= 1
         assert suggestions[0].after_step_index == 0
+        assert suggestions[0].confidence > 0.5
+        assert "form" in suggestions[0].reason.lower()
 
 
 class TestFormSubmissionEdgeCases:
     """Test form submission edge cases."""
 
-    def test_no_suggestion_when_element_text_is_none(self):
+    def test_no_suggestion_when_element_text_is_none(self, suggester):
         """Should not suggest form submission when element_text is None."""
-        mock_ai = MagicMock()
-        suggester = VerificationSuggester(ai_analyzer=mock_ai)
-
         steps = [
-            AnalyzedStep(
+            make_step(
                 index=0,
                 original_tap={"x": 200, "y": 500, "timestamp": 0.0},
                 element_text=None,  # No element text
                 before_description="Form screen",
                 after_description="Form modified",
-                suggested_verification=None,
             ),
         ]
 
@@ -179,13 +176,10 @@ class TestFormSubmissionEdgeCases:
 class TestSuggestOnNavigationChange:
     """Test verification suggestion on navigation change."""
 
-    def test_suggests_verification_on_screen_transition(self):
+    def test_suggests_verification_on_screen_transition(self, suggester):
         """Should suggest verification when screen changes significantly."""
-        mock_ai = MagicMock()
-        suggester = VerificationSuggester(ai_analyzer=mock_ai)
-
         steps = [
-            AnalyzedStep(
+            make_step(
                 index=0,
                 original_tap={"x": 100, "y": 100, "timestamp": 0.0},
                 element_text="Settings",
@@ -199,26 +193,20 @@ class TestSuggestOnNavigationChange:
 
         # Should suggest verification after navigation to Settings
         assert len(suggestions) >= 1
-        nav_suggestion = next(
-            (s for s in suggestions if s.after_step_index == 0), None
-        )
+        nav_suggestion = by_step_index(suggestions).get(0)
         assert nav_suggestion is not None
         reason_lower = nav_suggestion.reason.lower()
         assert "navigation" in reason_lower or "screen" in reason_lower
 
-    def test_suggests_verification_when_title_changes(self):
+    def test_suggests_verification_when_title_changes(self, suggester):
         """Should suggest verification when screen title/header changes."""
-        mock_ai = MagicMock()
-        suggester = VerificationSuggester(ai_analyzer=mock_ai)
-
         steps = [
-            AnalyzedStep(
+            make_step(
                 index=0,
                 original_tap={"x": 100, "y": 100, "timestamp": 0.0},
                 element_text="Profile",
                 before_description="Dashboard with title 'Home'",
                 after_description="Profile screen with title 'My Profile'",
-                suggested_verification=None,
             ),
         ]
 
@@ -230,61 +218,49 @@ class TestSuggestOnNavigationChange:
 class TestSuggestAfterLongPause:
     """Test verification suggestion after long pause."""
 
-    def test_suggests_verification_after_long_pause(self):
+    def test_suggests_verification_after_long_pause(self, suggester):
         """Should suggest verification when > 2 seconds pause before next tap."""
-        mock_ai = MagicMock()
-        suggester = VerificationSuggester(ai_analyzer=mock_ai)
-
         # Use element names that don't trigger form submission detection
         steps = [
-            AnalyzedStep(
+            make_step(
                 index=0,
                 original_tap={"x": 100, "y": 200, "timestamp": 0.0},
                 element_text="Item 1",  # Not a form submission keyword
                 before_description="List view",
                 after_description="Item details",  # Not a flow completion keyword
-                suggested_verification=None,
             ),
-            AnalyzedStep(
+            make_step(
                 index=1,
                 original_tap={"x": 100, "y": 300, "timestamp": 5.0},  # 5 second pause
                 element_text="Back",
                 before_description="Item details",
                 after_description="List view",
-                suggested_verification=None,
             ),
         ]
 
         suggestions = suggester.suggest(steps)
 
         # Should suggest verification after step 0 due to long pause before step 1
-        pause_suggestion = next(
-            (s for s in suggestions if s.after_step_index == 0), None
-        )
+        pause_suggestion = by_step_index(suggestions).get(0)
         assert pause_suggestion is not None
         assert "pause" in pause_suggestion.reason.lower()
 
-    def test_no_suggestion_for_short_pause(self):
+    def test_no_suggestion_for_short_pause(self, suggester):
         """Should not suggest verification for pauses < 2 seconds."""
-        mock_ai = MagicMock()
-        suggester = VerificationSuggester(ai_analyzer=mock_ai)
-
         steps = [
-            AnalyzedStep(
+            make_step(
                 index=0,
                 original_tap={"x": 100, "y": 200, "timestamp": 0.0},
                 element_text="Button1",
                 before_description="Screen A",
                 after_description="Screen A modified",
-                suggested_verification=None,
             ),
-            AnalyzedStep(
+            make_step(
                 index=1,
                 original_tap={"x": 100, "y": 300, "timestamp": 0.5},  # 0.5 second pause
                 element_text="Button2",
                 before_description="Screen A modified",
                 after_description="Screen A more modified",
-                suggested_verification=None,
             ),
         ]
 
@@ -297,97 +273,37 @@ class TestSuggestAfterLongPause:
         ]
         assert len(pause_suggestions) == 0
 
-    def test_no_pause_suggestion_when_timestamps_missing(self):
-        """Should not suggest pause verification when timestamps are missing."""
-        mock_ai = MagicMock()
-        suggester = VerificationSuggester(ai_analyzer=mock_ai)
-
-        steps = [
-            AnalyzedStep(
-                index=0,
-                original_tap={"x": 100, "y": 200},  # No timestamp
-                element_text="Item 1",
-                before_description="List view",
-                after_description="Item details",
-                suggested_verification=None,
-            ),
-            AnalyzedStep(
-                index=1,
-                original_tap={"x": 100, "y": 300},  # No timestamp
-                element_text="Back",
-                before_description="Item details",
-                after_description="List view",
-                suggested_verification=None,
-            ),
-        ]
-
-        suggestions = suggester.suggest(steps)
-
-        # Should not suggest pause verification without timestamps
-        pause_suggestions = [
-            s for s in suggestions if "pause" in s.reason.lower()
-        ]
-        assert len(pause_suggestions) == 0
-
-    def test_no_pause_suggestion_when_current_timestamp_missing(self):
-        """Should not suggest pause verification when current timestamp is missing."""
-        mock_ai = MagicMock()
-        suggester = VerificationSuggester(ai_analyzer=mock_ai)
-
-        steps = [
-            AnalyzedStep(
-                index=0,
-                original_tap={"x": 100, "y": 200},  # No timestamp
-                element_text="Item 1",
-                before_description="List view",
-                after_description="Item details",
-                suggested_verification=None,
-            ),
-            AnalyzedStep(
-                index=1,
-                original_tap={"x": 100, "y": 300, "timestamp": 5.0},
-                element_text="Back",
-                before_description="Item details",
-                after_description="List view",
-                suggested_verification=None,
-            ),
-        ]
-
-        suggestions = suggester.suggest(steps)
-
-        # Should not suggest pause verification without current timestamp
-        pause_suggestions = [
-            s for s in suggestions if "pause" in s.reason.lower()
-        ]
-        assert len(pause_suggestions) == 0
-
-    def test_no_pause_suggestion_when_next_timestamp_missing(self):
-        """Should not suggest pause verification when next timestamp is missing."""
-        mock_ai = MagicMock()
-        suggester = VerificationSuggester(ai_analyzer=mock_ai)
-
+    @pytest.mark.parametrize(
+        "ts0,ts1",
+        [(None, None), (None, 5.0), (0.0, None)],
+        ids=["both", "current", "next"],
+    )
+    def test_no_pause_suggestion_when_timestamp_missing(self, suggester, ts0, ts1):
+        """Should not suggest pause verification when either timestamp is missing."""
+        taps = [{"x": 100, "y": 200}, {"x": 100, "y": 300}]
+        for tap, ts in zip(taps, (ts0, ts1)):
+            if ts is not None:
+                tap["timestamp"] = ts
         steps = [
-            AnalyzedStep(
+            make_step(
                 index=0,
-                original_tap={"x": 100, "y": 200, "timestamp": 0.0},
+                original_tap=taps[0],
                 element_text="Item 1",
                 before_description="List view",
                 after_description="Item details",
-                suggested_verification=None,
             ),
-            AnalyzedStep(
+            make_step(
                 index=1,
-                original_tap={"x": 100, "y": 300},  # No timestamp
+                original_tap=taps[1],
                 element_text="Back",
                 before_description="Item details",
                 after_description="List view",
-                suggested_verification=None,
             ),
         ]
 
         suggestions = suggester.suggest(steps)
 
-        # Should not suggest pause verification without next timestamp
+        # Should not suggest pause verification without both timestamps
         pause_suggestions = [
             s for s in suggestions if "pause" in s.reason.lower()
         ]
@@ -397,107 +313,47 @@ class TestSuggestAfterLongPause:
 class TestSuggestOnFlowKeywords:
     """Test verification suggestion on flow completion keywords."""
 
-    def test_suggests_verification_on_success_keyword(self):
-        """Should suggest verification when 'success' appears in after_description."""
-        mock_ai = MagicMock()
-        suggester = VerificationSuggester(ai_analyzer=mock_ai)
-
-        steps = [
-            AnalyzedStep(
-                index=0,
-                original_tap={"x": 200, "y": 400, "timestamp": 0.0},
-                element_text="Confirm",
-                before_description="Confirmation dialog",
-                after_description="Success message displayed",
-                suggested_verification="Operation completed successfully",
-            ),
-        ]
-
-        suggestions = suggester.suggest(steps)
-
-        assert len(suggestions) >= 1
-        success_suggestion = next(
-            (s for s in suggestions if s.after_step_index == 0), None
-        )
-        assert success_suggestion is not None
-
-    def test_suggests_verification_on_welcome_keyword(self):
-        """Should suggest verification when 'welcome' appears."""
-        mock_ai = MagicMock()
-        suggester = VerificationSuggester(ai_analyzer=mock_ai)
-
-        steps = [
-            AnalyzedStep(
-                index=0,
-                original_tap={"x": 200, "y": 400, "timestamp": 0.0},
-                element_text="Get Started",
-                before_description="Onboarding screen",
-                after_description="Welcome screen with user name",
-                suggested_verification=None,
-            ),
-        ]
-
-        suggestions = suggester.suggest(steps)
-
-        assert len(suggestions) >= 1
-
-    def test_suggests_verification_on_dashboard_keyword(self):
-        """Should suggest verification when 'dashboard' appears."""
-        mock_ai = MagicMock()
-        suggester = VerificationSuggester(ai_analyzer=mock_ai)
-
-        steps = [
-            AnalyzedStep(
-                index=0,
-                original_tap={"x": 200, "y": 400, "timestamp": 0.0},
-                element_text="Login",
-                before_description="Login form",
-                after_description="User dashboard with stats",
-                suggested_verification=None,
-            ),
-        ]
-
-        suggestions = suggester.suggest(steps)
-
-        assert len(suggestions) >= 1
-
-    def test_suggests_verification_on_complete_keyword(self):
-        """Should suggest verification when 'complete' appears."""
-        mock_ai = MagicMock()
-        suggester = VerificationSuggester(ai_analyzer=mock_ai)
-
+    @pytest.mark.parametrize(
+        "after_desc, keyword",
+        [
+            ("Success message shown", "success"),
+            ("Welcome banner with user name", "welcome"),
+            ("User dashboard with stats", "dashboard"),
+            ("Task complete message", "complete"),
+        ],
+    )
+    def test_suggests_verification_on_flow_keyword(self, suggester, after_desc, keyword):
+        """Should suggest flow-completion verification when after_description has a keyword."""
         steps = [
-            AnalyzedStep(
+            make_step(
                 index=0,
                 original_tap={"x": 200, "y": 400, "timestamp": 0.0},
-                element_text="Finish",
-                before_description="Final step",
-                after_description="Task complete confirmation",
-                suggested_verification=None,
+                element_text="Item",
+                before_description="Item list",
+                after_description=after_desc,
             ),
         ]
 
         suggestions = suggester.suggest(steps)
 
-        assert len(suggestions) >= 1
+        assert len(suggestions) == 1
+        reason = suggestions[0].reason
+        assert "flow completion" in reason.lower()
+        assert f"'{keyword}'" in reason
 
 
 class TestNoneDescriptionHandling:
     """Test handling of None values for descriptions."""
 
-    def test_no_flow_completion_when_after_description_is_none(self):
+    def test_no_flow_completion_when_after_description_is_none(self, suggester):
         """Should not crash when after_description is None in flow completion check."""
-        mock_ai = MagicMock()
-        suggester = VerificationSuggester(ai_analyzer=mock_ai)
-
         steps = [
-            AnalyzedStep(
+            make_step(
                 index=0,
                 original_tap={"x": 200, "y": 400, "timestamp": 0.0},
                 element_text="Button",
                 before_description="Some screen",
                 after_description=None,  # None after_description
-                suggested_verification=None,
             ),
         ]
 
@@ -511,19 +367,15 @@ class TestNoneDescriptionHandling:
         ]
         assert len(flow_suggestions) == 0
 
-    def test_no_navigation_change_when_descriptions_are_none(self):
+    def test_no_navigation_change_when_descriptions_are_none(self, suggester):
         """Should not crash when before/after descriptions are None in navigation check."""
-        mock_ai = MagicMock()
-        suggester = VerificationSuggester(ai_analyzer=mock_ai)
-
         steps = [
-            AnalyzedStep(
+            make_step(
                 index=0,
                 original_tap={"x": 100, "y": 100, "timestamp": 0.0},
                 element_text="Menu",
                 before_description=None,  # None before_description
                 after_description=None,  # None after_description
-                suggested_verification=None,
             ),
         ]
 
@@ -536,19 +388,15 @@ class TestNoneDescriptionHandling:
         ]
         assert len(nav_suggestions) == 0
 
-    def test_no_navigation_when_only_before_description_is_none(self):
+    def test_no_navigation_when_only_before_description_is_none(self, suggester):
         """Should not crash when only before_description is None."""
-        mock_ai = MagicMock()
-        suggester = VerificationSuggester(ai_analyzer=mock_ai)
-
         steps = [
-            AnalyzedStep(
+            make_step(
                 index=0,
                 original_tap={"x": 100, "y": 100, "timestamp": 0.0},
                 element_text="Settings",
                 before_description=None,  # None before_description
                 after_description="Settings screen displayed",
-                suggested_verification=None,
             ),
         ]
 
@@ -563,28 +411,23 @@ class TestNoneDescriptionHandling:
 class TestEmptyAndLimitedResults:
     """Test edge cases for empty results and limits."""
 
-    def test_returns_empty_list_when_no_verifications_needed(self):
+    def test_returns_empty_list_when_no_verifications_needed(self, suggester):
         """Should return empty list when no verification criteria met."""
-        mock_ai = MagicMock()
-        suggester = VerificationSuggester(ai_analyzer=mock_ai)
-
         # Simple taps with no significant changes
         steps = [
-            AnalyzedStep(
+            make_step(
                 index=0,
                 original_tap={"x": 100, "y": 200, "timestamp": 0.0},
                 element_text="Tab1",
                 before_description="Home tab",
                 after_description="Home tab selected",
-                suggested_verification=None,
             ),
-            AnalyzedStep(
+            make_step(
                 index=1,
                 original_tap={"x": 200, "y": 200, "timestamp": 0.3},
                 element_text="Tab2",
                 before_description="Home tab selected",
                 after_description="Tab2 selected",
-                suggested_verification=None,
             ),
         ]
 
@@ -595,46 +438,36 @@ class TestEmptyAndLimitedResults:
         high_confidence = [s for s in suggestions if s.confidence > 0.7]
         assert len(high_confidence) == 0
 
-    def test_returns_empty_list_for_empty_steps(self):
+    def test_returns_empty_list_for_empty_steps(self, suggester):
         """Should return empty list when no steps provided."""
-        mock_ai = MagicMock()
-        suggester = VerificationSuggester(ai_analyzer=mock_ai)
-
         suggestions = suggester.suggest([])
 
         assert suggestions == []
 
-    def test_limits_suggestions_to_max_five(self):
+    def test_limits_suggestions_to_max_five(self, suggester):
         """Should limit suggestions to maximum 5 per recording."""
-        mock_ai = MagicMock()
-        suggester = VerificationSuggester(ai_analyzer=mock_ai)
-
         # Create many steps that would all trigger suggestions
-        steps = []
-        for i in range(10):
-            steps.append(
-                AnalyzedStep(
-                    index=i,
-                    original_tap={"x": 100, "y": 200, "timestamp": float(i * 3)},  # 3s between each
-                    element_text="Submit",
-                    before_description="Form filled",
-                    after_description="Success message displayed",
-                    suggested_verification="Submission successful",
-                )
+        steps = [
+            make_step(
+                index=i,
+                original_tap={"x": 100, "y": 200, "timestamp": float(i * 3)},  # 3s between each
+                element_text="Submit",
+                before_description="Form filled",
+                after_description="Success message displayed",
+                suggested_verification="Submission successful",
             )
+            for i in range(10)
+        ]
 
         suggestions = suggester.suggest(steps)
 
         # Should be limited to max 5
         assert len(suggestions) <= 5
 
-    def test_suggestions_sorted_by_confidence(self):
+    def test_suggestions_sorted_by_confidence(self, suggester):
         """Suggestions should be sorted by confidence (highest first)."""
-        mock_ai = MagicMock()
-        suggester = VerificationSuggester(ai_analyzer=mock_ai)
-
         steps = [
-            AnalyzedStep(
+            make_step(
                 index=0,
                 original_tap={"x": 100, "y": 200, "timestamp": 0.0},
                 element_text="Login",  # Form submission - high confidence
@@ -642,13 +475,12 @@ class TestEmptyAndLimitedResults:
                 after_description="Dashboard with welcome message",  # Flow keyword
                 suggested_verification="User logged in",
             ),
-            AnalyzedStep(
+            make_step(
                 index=1,
                 original_tap={"x": 100, "y": 300, "timestamp": 3.0},  # Long pause
                 element_text="Menu",
                 before_description="Dashboard",
                 after_description="Menu opened",
-                suggested_verification=None,
             ),
         ]
 
@@ -663,13 +495,10 @@ class TestEmptyAndLimitedResults:
 class TestDescriptionGeneration:
     """Test verification description generation."""
 
-    def test_uses_suggested_verification_when_available(self):
+    def test_uses_suggested_verification_when_available(self, suggester):
         """Should use AI's suggested_verification when available."""
-        mock_ai = MagicMock()
-        suggester = VerificationSuggester(ai_analyzer=mock_ai)
-
         steps = [
-            AnalyzedStep(
+            make_step(
                 index=0,
                 original_tap={"x": 200, "y": 400, "timestamp": 0.0},
                 element_text="Submit",
@@ -685,19 +514,15 @@ class TestDescriptionGeneration:
         # Should use the AI-suggested verification
         assert suggestions[0].description == "Form submitted successfully"
 
-    def test_generates_description_from_after_state(self):
+    def test_generates_description_from_after_state(self, suggester):
         """Should generate description from after_description when no suggested_verification."""
-        mock_ai = MagicMock()
-        suggester = VerificationSuggester(ai_analyzer=mock_ai)
-
         steps = [
-            AnalyzedStep(
+            make_step(
                 index=0,
                 original_tap={"x": 200, "y": 400, "timestamp": 0.0},
                 element_text="Login",
                 before_description="Login form",
                 after_description="User dashboard displayed",
-                suggested_verification=None,
             ),
         ]
 
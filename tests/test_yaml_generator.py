@@ -1,7 +1,6 @@
 """Tests for YAMLGenerator."""
 
-from pathlib import Path
-
+import pytest
 import yaml
 
 from mutcli.core.step_analyzer import AnalyzedStep
@@ -9,139 +8,220 @@ from mutcli.core.typing_detector import TypingSequence
 from mutcli.core.verification_suggester import VerificationPoint
 from mutcli.core.yaml_generator import YAMLGenerator
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader  # type: ignore[assignment]
 
-class TestYAMLGeneratorInitialization:
-    """Test YAMLGenerator initialization."""
-
-    def test_stores_name_and_app_package(self):
-        """Should store test name and app package."""
-        gen = YAMLGenerator("login_test", "com.example.app")
-
-        assert gen._name == "login_test"
-        assert gen._app_package == "com.example.app"
-
-    def test_initializes_empty_steps(self):
-        """Should initialize with empty steps list."""
-        gen = YAMLGenerator("test", "com.example.app")
+TEST_NAME = "test"
+APP_PACKAGE = "com.example.app"
+OTHER_PACKAGE = "com.other.app"
 
-        assert gen._steps == []
-
-    def test_initializes_empty_setup_teardown(self):
-        """Should initialize with empty setup and teardown."""
-        gen = YAMLGenerator("test", "com.example.app")
-
-        assert gen._setup == []
-        assert gen._teardown == []
 
+def load_yaml(content):
+    """Parse generated YAML with the libyaml loader when available."""
+    return yaml.load(content, Loader=SafeLoader)
 
-class TestAddTap:
-    """Test add_tap method."""
 
-    def test_tap_uses_element_when_provided(self):
-        """tap should use element text when provided."""
-        gen = YAMLGenerator("test", "com.example.app")
+def top_level_keys(yaml_str):
+    """Top-level mapping keys of generated YAML, in document order."""
+    node = yaml.compose(yaml_str, Loader=SafeLoader)
+    return [key.value for key, _ in node.value]
 
-        gen.add_tap(540, 1200, element="Login button")
-
-        assert len(gen._steps) == 1
-        assert gen._steps[0] == {"tap": "Login button"}
 
-    def test_tap_uses_coordinates_when_no_element(self):
-        """tap should use coordinates when no element provided."""
-        gen = YAMLGenerator("test", "com.example.app")
+def make_step(index, x, y, timestamp, element_text=None):
+    """Helper to create AnalyzedStep for a tap at (x, y)."""
+    return AnalyzedStep(
+        index=index,
+        original_tap={"x": x, "y": y, "timestamp": timestamp},
+        element_text=element_text,
+        before_description="",
+        after_description="",
+    )
 
-        gen.add_tap(540, 1200)
 
-        assert len(gen._steps) == 1
-        assert gen._steps[0] == {"tap": [540, 1200]}
+@pytest.fixture
+def gen():
+    """Fresh generator with the default test name and app package."""
+    return YAMLGenerator(TEST_NAME, APP_PACKAGE)
 
-    def test_tap_prefers_element_over_coordinates(self):
-        """tap should prefer element text over coordinates."""
-        gen = YAMLGenerator("test", "com.example.app")
 
-        gen.add_tap(100, 200, element="Submit")
+@pytest.fixture(scope="session")
+def save_root(tmp_path_factory):
+    """One temporary directory shared by every save test in the session."""
+    return tmp_path_factory.mktemp("yamlgen")
 
-        # Should use element, not coordinates
-        assert gen._steps[0] == {"tap": "Submit"}
 
+@pytest.fixture
+def output_dir(save_root, request):
+    """Per-test directory under save_root; save() creates it on demand."""
+    return save_root / request.node.name
 
-class TestAddType:
-    """Test add_type method."""
 
-    def test_type_with_just_text(self):
-        """type with just text should use simple syntax."""
-        gen = YAMLGenerator("test", "com.example.app")
+@pytest.fixture(scope="module")
+def new_generator():
+    """Untouched generator shared by read-only initialization tests."""
+    return YAMLGenerator("login_test", APP_PACKAGE)
 
-        gen.add_type("user@test.com")
 
-        assert gen._steps[0] == {"type": "user@test.com"}
-
-    def test_type_with_text_and_field(self):
-        """type with text and field should use rich syntax."""
-        gen = YAMLGenerator("test", "com.example.app")
-
-        gen.add_type("user@test.com", field="Email")
-
-        assert gen._steps[0] == {"type": {"text": "user@test.com", "field": "Email"}}
-
-    def test_type_with_submit(self):
-        """type with submit=True should include submit flag."""
-        gen = YAMLGenerator("test", "com.example.app")
-
-        gen.add_type("search query", submit=True)
-
-        assert gen._steps[0] == {"type": {"text": "search query", "submit": True}}
-
-    def test_type_with_submit_false(self):
-        """type with submit=False should use simple syntax."""
-        gen = YAMLGenerator("test", "com.example.app")
-
-        gen.add_type("some text", submit=False)
+class TestYAMLGeneratorInitialization:
+    """Test YAMLGenerator initialization."""
 
-        assert gen._steps[0] == {"type": "some text"}
+    @pytest.mark.parametrize(
+        "attr,expected",
+        [
+            ("_name", "login_test"),
+            ("_app_package", "com.example.app"),
+            ("_steps", []),
+            ("_setup", []),
+            ("_teardown", []),
+        ],
+    )
+    def test_initial_state(self, new_generator, attr, expected):
+        """Should store name and app package and start with empty sections."""
+        assert getattr(new_generator, attr) == expected
+
+
+# (method, args, kwargs, expected step); one case per add_* behaviour
+ADD_STEP_CASES = [
+    pytest.param(
+        "add_tap",
+        (540, 1200),
+        {"element": "Login button"},
+        {"tap": "Login button"},
+        id="tap-uses-element",
+    ),
+    pytest.param("add_tap", (540, 1200), {}, {"tap": [540, 1200]}, id="tap-uses-coordinates"),
+    pytest.param(
+        "add_tap",
+        (100, 200),
+        {"element": "Submit"},
+        {"tap": "Submit"},
+        id="tap-prefers-element",
+    ),
+    pytest.param("add_type", ("user@test.com",), {}, {"type": "user@test.com"}, id="type-text"),
+    pytest.param(
+        "add_type",
+        ("user@test.com",),
+        {"field": "Email"},
+        {"type": {"text": "user@test.com", "field": "Email"}},
+        id="type-with-field",
+    ),
+    pytest.param(
+        "add_type",
+        ("search query",),
+        {"submit": True},
+        {"type": {"text": "search query", "submit": True}},
+        id="type-with-submit",
+    ),
+    pytest.param(
+        "add_type",
+        ("some text",),
+        {"submit": False},
+        {"type": "some text"},
+        id="type-with-submit-false",
+    ),
+    pytest.param("add_swipe", ("up",), {}, {"swipe": {"direction": "up"}}, id="swipe-direction"),
+    pytest.param(
+        "add_swipe",
+        ("down",),
+        {"distance": "50%"},
+        {"swipe": {"direction": "down", "distance": "50%"}},
+        id="swipe-with-distance",
+    ),
+    pytest.param(
+        "add_swipe",
+        ("up",),
+        {"from_coords": (540, 1170)},
+        {"swipe": {"direction": "up", "from": [540, 1170]}},
+        id="swipe-from-pixels-without-screen-size",
+    ),
+    pytest.param("add_wait", ("2s",), {}, {"wait": "2s"}, id="wait-seconds"),
+    pytest.param("add_wait", ("500ms",), {}, {"wait": "500ms"}, id="wait-milliseconds"),
+    pytest.param(
+        "add_wait_for",
+        ("Loading complete",),
+        {},
+        {"wait_for": "Loading complete"},
+        id="wait-for-element",
+    ),
+    pytest.param(
+        "add_wait_for",
+        ("Dashboard",),
+        {"timeout": "30s"},
+        {"wait_for": {"element": "Dashboard", "timeout": "30s"}},
+        id="wait-for-with-timeout",
+    ),
+    pytest.param(
+        "add_verify_screen",
+        ("User is logged in",),
+        {},
+        {"verify_screen": "User is logged in"},
+        id="verify-screen",
+    ),
+]
+
+# (method, args, section attribute, expected entry)
+ADD_LIFECYCLE_CASES = [
+    pytest.param("add_launch_app", (), "_setup", "launch_app", id="launch-default"),
+    pytest.param(
+        "add_launch_app",
+        (OTHER_PACKAGE,),
+        "_setup",
+        {"launch_app": "com.other.app"},
+        id="launch-with-package",
+    ),
+    pytest.param("add_terminate_app", (), "_teardown", "terminate_app", id="terminate-default"),
+    pytest.param(
+        "add_terminate_app",
+        (OTHER_PACKAGE,),
+        "_teardown",
+        {"terminate_app": "com.other.app"},
+        id="terminate-with-package",
+    ),
+]
+
+
+class TestAddActions:
+    """Test the add_* methods that build steps, setup and teardown."""
+
+    @pytest.mark.parametrize("method,args,kwargs,expected", ADD_STEP_CASES)
+    def test_add_step(self, gen, method, args, kwargs, expected):
+        """Each add_* call should append exactly the expected step."""
+        getattr(gen, method)(*args, **kwargs)
+
+        assert gen._steps == [expected]
+
+    @pytest.mark.parametrize("method,args,section,expected", ADD_LIFECYCLE_CASES)
+    def test_add_lifecycle_action(self, gen, method, args, section, expected):
+        """launch_app/terminate_app should go to setup/teardown, not steps."""
+        getattr(gen, method)(*args)
+
+        assert getattr(gen, section) == [expected]
+        assert gen._steps == []
 
 
 class TestAddSwipe:
     """Test add_swipe method."""
 
-    def test_swipe_direction_only(self):
-        """swipe with direction only should use simple syntax."""
-        gen = YAMLGenerator("test", "com.example.app")
-
-        gen.add_swipe("up")
-
-        assert gen._steps[0] == {"swipe": {"direction": "up"}}
-
-    def test_swipe_with_distance(self):
-        """swipe with distance should include distance."""
-        gen = YAMLGenerator("test", "com.example.app")
-
-        gen.add_swipe("down", distance="50%")
-
-        assert gen._steps[0] == {"swipe": {"direction": "down", "distance": "50%"}}
-
-    def test_swipe_validates_direction(self):
+    @pytest.mark.parametrize("direction", ["up", "down", "left", "right"])
+    def test_swipe_validates_direction(self, gen, direction):
         """swipe should accept valid directions."""
-        gen = YAMLGenerator("test", "com.example.app")
-
-        for direction in ["up", "down", "left", "right"]:
-            gen.add_swipe(direction)
+        gen.add_swipe(direction)
 
-        assert len(gen._steps) == 4
+        assert gen._steps == [{"swipe": {"direction": direction}}]
 
     def test_swipe_with_from_coords(self):
         """swipe with from_coords should include from field as percentages."""
-        gen = YAMLGenerator("test", "com.example.app", screen_width=1080, screen_height=2340)
+        gen = YAMLGenerator(TEST_NAME, APP_PACKAGE, screen_width=1080, screen_height=2340)
 
         gen.add_swipe("left", from_coords=(540, 1170))
 
-        assert gen._steps[0] == {
-            "swipe": {"direction": "left", "from": ["50.0%", "50.0%"]}
-        }
+        assert gen._steps == [{"swipe": {"direction": "left", "from": ["50.0%", "50.0%"]}}]
 
     def test_swipe_with_all_options(self):
         """swipe with all options should include all fields."""
-        gen = YAMLGenerator("test", "com.example.app", screen_width=1080, screen_height=2340)
+        gen = YAMLGenerator(TEST_NAME, APP_PACKAGE, screen_width=1080, screen_height=2340)
 
         gen.add_swipe(
             "right",
@@ -151,261 +231,138 @@ class TestAddSwipe:
             from_coords=(108, 2106),
         )
 
-        assert gen._steps[0] == {
-            "swipe": {
-                "direction": "right",
-                "distance": "75%",
-                "duration": "500ms",
-                "from": ["10.0%", "90.0%"],
-            },
-            "description": "Swipe right to dismiss",
-        }
-
-    def test_swipe_from_coords_without_screen_dimensions(self):
-        """swipe with from_coords but no screen dimensions should use pixels."""
-        gen = YAMLGenerator("test", "com.example.app")
-
-        gen.add_swipe("up", from_coords=(540, 1170))
-
-        # Without screen dimensions, coordinates are kept as pixels
-        assert gen._steps[0] == {
-            "swipe": {"direction": "up", "from": [540, 1170]}
-        }
-
-
-class TestAddWait:
-    """Test add_wait method."""
-
-    def test_wait_with_duration(self):
-        """wait should store duration string."""
-        gen = YAMLGenerator("test", "com.example.app")
-
-        gen.add_wait("2s")
-
-        assert gen._steps[0] == {"wait": "2s"}
-
-    def test_wait_with_milliseconds(self):
-        """wait should accept milliseconds."""
-        gen = YAMLGenerator("test", "com.example.app")
-
-        gen.add_wait("500ms")
-
-        assert gen._steps[0] == {"wait": "500ms"}
-
-
-class TestAddWaitFor:
-    """Test add_wait_for method."""
-
-    def test_wait_for_element(self):
-        """wait_for should store element text."""
-        gen = YAMLGenerator("test", "com.example.app")
-
-        gen.add_wait_for("Loading complete")
-
-        assert gen._steps[0] == {"wait_for": "Loading complete"}
-
-    def test_wait_for_with_timeout(self):
-        """wait_for with timeout should use rich syntax."""
-        gen = YAMLGenerator("test", "com.example.app")
-
-        gen.add_wait_for("Dashboard", timeout="30s")
-
-        assert gen._steps[0] == {"wait_for": {"element": "Dashboard", "timeout": "30s"}}
-
-
-class TestAddVerifyScreen:
-    """Test add_verify_screen method."""
-
-    def test_verify_screen(self):
-        """verify_screen should store description."""
-        gen = YAMLGenerator("test", "com.example.app")
-
-        gen.add_verify_screen("User is logged in")
-
-        assert gen._steps[0] == {"verify_screen": "User is logged in"}
-
-
-class TestAddLaunchApp:
-    """Test add_launch_app method."""
-
-    def test_launch_app_default(self):
-        """launch_app without package should add simple action to setup."""
-        gen = YAMLGenerator("test", "com.example.app")
-
-        gen.add_launch_app()
-
-        assert len(gen._setup) == 1
-        assert gen._setup[0] == "launch_app"
-
-    def test_launch_app_with_package(self):
-        """launch_app with package should include package."""
-        gen = YAMLGenerator("test", "com.example.app")
-
-        gen.add_launch_app("com.other.app")
-
-        assert gen._setup[0] == {"launch_app": "com.other.app"}
-
-
-class TestAddTerminateApp:
-    """Test add_terminate_app method."""
-
-    def test_terminate_app_default(self):
-        """terminate_app without package should add simple action to teardown."""
-        gen = YAMLGenerator("test", "com.example.app")
-
-        gen.add_terminate_app()
-
-        assert len(gen._teardown) == 1
-        assert gen._teardown[0] == "terminate_app"
-
-    def test_terminate_app_with_package(self):
-        """terminate_app with package should include package."""
-        gen = YAMLGenerator("test", "com.example.app")
-
-        gen.add_terminate_app("com.other.app")
-
-        assert gen._teardown[0] == {"terminate_app": "com.other.app"}
+        assert gen._steps == [
+            {
+                "swipe": {
+                    "direction": "right",
+                    "distance": "75%",
+                    "duration": "500ms",
+                    "from": ["10.0%", "90.0%"],
+                },
+                "description": "Swipe right to dismiss",
+            }
+        ]
 
 
 class TestGenerate:
     """Test generate method."""
 
     def test_generates_basic_structure(self):
-        """generate should create valid YAML with config."""
-        gen = YAMLGenerator("login_test", "com.example.app")
+        """generate should round-trip config, setup, steps and teardown through YAML."""
+        gen = YAMLGenerator("login_test", APP_PACKAGE)
+        gen.add_launch_app()
+        gen.add_tap(540, 1200, element="Login")
+        gen.add_type("user@test.com")
+        gen.add_terminate_app()
 
-        yaml_str = gen.generate()
-        data = yaml.safe_load(yaml_str)
+        data = load_yaml(gen.generate())
 
-        assert "config" in data
-        assert data["config"]["app"] == "com.example.app"
+        assert data == {
+            "config": {"app": "com.example.app"},
+            "setup": ["launch_app"],
+            "steps": [{"tap": "Login"}, {"type": "user@test.com"}],
+            "teardown": ["terminate_app"],
+        }
 
-    def test_generates_steps(self):
+    def test_generates_steps(self, gen):
         """generate should include steps."""
-        gen = YAMLGenerator("test", "com.example.app")
         gen.add_tap(540, 1200, element="Login")
         gen.add_type("user@test.com")
 
-        yaml_str = gen.generate()
-        data = yaml.safe_load(yaml_str)
-
-        assert "steps" in data
-        assert len(data["steps"]) == 2
+        assert load_yaml(gen.generate())["steps"] == [{"tap": "Login"}, {"type": "user@test.com"}]
 
-    def test_generates_setup_section(self):
+    def test_generates_setup_section(self, gen):
         """generate should include setup section when present."""
-        gen = YAMLGenerator("test", "com.example.app")
         gen.add_launch_app()
         gen.add_tap(100, 200, element="Start")
 
-        yaml_str = gen.generate()
-        data = yaml.safe_load(yaml_str)
+        assert top_level_keys(gen.generate()) == ["config", "setup", "steps"]
 
-        assert "setup" in data
-        assert data["setup"] == ["launch_app"]
-
-    def test_generates_teardown_section(self):
+    def test_generates_teardown_section(self, gen):
         """generate should include teardown section when present."""
-        gen = YAMLGenerator("test", "com.example.app")
         gen.add_tap(100, 200, element="Done")
         gen.add_terminate_app()
 
-        yaml_str = gen.generate()
-        data = yaml.safe_load(yaml_str)
-
-        assert "teardown" in data
-        assert data["teardown"] == ["terminate_app"]
+        assert top_level_keys(gen.generate()) == ["config", "steps", "teardown"]
 
-    def test_omits_empty_setup(self):
+    def test_omits_empty_setup(self, gen):
         """generate should omit setup section when empty."""
-        gen = YAMLGenerator("test", "com.example.app")
         gen.add_tap(100, 200, element="Button")
 
-        yaml_str = gen.generate()
-        data = yaml.safe_load(yaml_str)
-
-        assert "setup" not in data
+        assert "setup" not in top_level_keys(gen.generate())
 
-    def test_omits_empty_teardown(self):
+    def test_omits_empty_teardown(self, gen):
         """generate should omit teardown section when empty."""
-        gen = YAMLGenerator("test", "com.example.app")
         gen.add_tap(100, 200, element="Button")
 
-        yaml_str = gen.generate()
-        data = yaml.safe_load(yaml_str)
+        assert "teardown" not in top_level_keys(gen.generate())
 
-        assert "teardown" not in data
-
-    def test_generates_empty_steps_list(self):
+    def test_generates_empty_steps_list(self, gen):
         """generate should include empty steps list when no steps added."""
-        gen = YAMLGenerator("test", "com.example.app")
-
-        yaml_str = gen.generate()
-        data = yaml.safe_load(yaml_str)
+        assert "steps: []" in gen.generate().splitlines()
 
-        assert "steps" in data
-        assert data["steps"] == []
-
-    def test_preserves_key_order(self):
+    def test_preserves_key_order(self, gen):
         """generate should preserve key order: config, setup, steps, teardown."""
-        gen = YAMLGenerator("test", "com.example.app")
         gen.add_launch_app()
         gen.add_tap(100, 200, element="Button")
         gen.add_terminate_app()
 
-        yaml_str = gen.generate()
+        assert top_level_keys(gen.generate()) == ["config", "setup", "steps", "teardown"]
 
-        # Check order by finding positions
-        config_pos = yaml_str.find("config:")
-        setup_pos = yaml_str.find("setup:")
-        steps_pos = yaml_str.find("steps:")
-        teardown_pos = yaml_str.find("teardown:")
+    def test_long_multiline_step_text_round_trips(self, gen):
+        """generate should keep long, multi-line step text intact through a YAML load."""
+        text = (
+            "Dashboard shows the user's name and balance above the recent transactions \n"
+            " list with the latest payment highlighted"
+        )
+        gen.add_verify_screen(text)
 
-        assert config_pos < setup_pos < steps_pos < teardown_pos
+        assert load_yaml(gen.generate())["steps"] == [{"verify_screen": text}]
 
 
 class TestSave:
     """Test save method."""
 
-    def test_saves_to_file(self, tmp_path):
-        """save should write YAML to file."""
-        gen = YAMLGenerator("test", "com.example.app")
+    @pytest.mark.parametrize(
+        "relative_path,as_string",
+        [("test.yaml", False), ("nested/dir/test.yaml", False), ("test.yaml", True)],
+        ids=["path", "creates-parent-directories", "string-path"],
+    )
+    def test_saves_generated_yaml(self, gen, output_dir, relative_path, as_string):
+        """save should write the generated YAML, creating parents, for Path or str."""
         gen.add_tap(540, 1200, element="Login")
 
-        output_path = tmp_path / "test.yaml"
-        gen.save(output_path)
-
-        assert output_path.exists()
-        content = output_path.read_text()
-        data = yaml.safe_load(content)
-        assert data["config"]["app"] == "com.example.app"
-
-    def test_creates_parent_directory(self, tmp_path):
-        """save should create parent directories if they don't exist."""
-        gen = YAMLGenerator("test", "com.example.app")
-        gen.add_tap(540, 1200)
+        output_path = output_dir / relative_path
+        gen.save(str(output_path) if as_string else output_path)
 
-        nested_path = tmp_path / "nested" / "dir" / "test.yaml"
-        gen.save(nested_path)
-
-        assert nested_path.exists()
-
-    def test_accepts_string_path(self, tmp_path):
-        """save should accept string path."""
-        gen = YAMLGenerator("test", "com.example.app")
+        assert load_yaml(output_path.read_text()) == {
+            "config": {"app": "com.example.app"},
+            "steps": [{"tap": "Login"}],
+        }
 
-        path_str = str(tmp_path / "test.yaml")
-        gen.save(path_str)
 
-        assert Path(path_str).exists()
+# Document the login workflow below should save (config carries no name)
+LOGIN_WORKFLOW = {
+    "config": {"app": "com.example.app"},
+    "setup": ["launch_app"],
+    "steps": [
+        {"wait_for": "Login button"},
+        {"tap": "Login button"},
+        {"type": {"text": "user@test.com", "field": "Email"}},
+        {"type": {"text": "password123", "field": "Password"}},
+        {"tap": "Submit"},
+        {"verify_screen": "User is logged in and dashboard is visible"},
+    ],
+    "teardown": ["terminate_app"],
+}
 
 
 class TestCompleteWorkflow:
     """Test complete workflow scenarios."""
 
-    def test_full_login_test(self, tmp_path):
+    def test_full_login_test(self, output_dir):
         """Complete login test workflow."""
-        gen = YAMLGenerator("login_test", "com.example.app")
+        gen = YAMLGenerator("login_test", APP_PACKAGE)
 
         # Setup
         gen.add_launch_app()
@@ -422,19 +379,16 @@ class TestCompleteWorkflow:
         gen.add_terminate_app()
 
         # Save and verify
-        output = tmp_path / "login.yaml"
+        output = output_dir / "login.yaml"
         gen.save(output)
 
-        data = yaml.safe_load(output.read_text())
+        data = load_yaml(output.read_text())
 
-        assert data["config"]["app"] == "com.example.app"
-        assert data["setup"] == ["launch_app"]
-        assert len(data["steps"]) == 6
-        assert data["teardown"] == ["terminate_app"]
+        assert data == LOGIN_WORKFLOW
 
-    def test_swipe_navigation_test(self, tmp_path):
+    def test_swipe_navigation_test(self):
         """Swipe navigation test workflow."""
-        gen = YAMLGenerator("carousel_test", "com.example.app")
+        gen = YAMLGenerator("carousel_test", APP_PACKAGE)
 
         gen.add_launch_app()
         gen.add_wait("2s")
@@ -443,77 +397,51 @@ class TestCompleteWorkflow:
         gen.add_swipe("right")
         gen.add_terminate_app()
 
-        yaml_str = gen.generate()
-        data = yaml.safe_load(yaml_str)
+        data = gen._build_document()
 
-        assert len(data["steps"]) == 4
-        assert data["steps"][0] == {"wait": "2s"}
-        assert data["steps"][1] == {"swipe": {"direction": "left"}}
-        assert data["steps"][2] == {"swipe": {"direction": "left", "distance": "75%"}}
+        assert data["steps"] == [
+            {"wait": "2s"},
+            {"swipe": {"direction": "left"}},
+            {"swipe": {"direction": "left", "distance": "75%"}},
+            {"swipe": {"direction": "right"}},
+        ]
 
 
 class TestAddAnalyzedStep:
     """Test add_analyzed_step method."""
 
-    def test_uses_element_text_when_available(self):
+    def test_uses_element_text_when_available(self, gen):
         """add_analyzed_step should use element_text with fallback coordinates."""
-        gen = YAMLGenerator("test", "com.example.app")
-        step = AnalyzedStep(
-            index=0,
-            original_tap={"x": 540, "y": 1200, "timestamp": 1.0},
-            element_text="Login Button",
-            before_description="Login screen",
-            after_description="Loading",
-            suggested_verification=None,
-        )
+        step = make_step(0, 540, 1200, 1.0, "Login Button")
 
         gen.add_analyzed_step(step)
 
-        assert len(gen._steps) == 1
         # Rich format: element text primary, coordinates as fallback
-        assert gen._steps[0] == {"tap": "Login Button", "at": [540, 1200]}
+        assert gen._steps == [{"tap": "Login Button", "at": [540, 1200]}]
 
-    def test_falls_back_to_coordinates_when_no_element_text(self):
+    def test_falls_back_to_coordinates_when_no_element_text(self, gen):
         """add_analyzed_step should use coordinates when element_text is None."""
-        gen = YAMLGenerator("test", "com.example.app")
-        step = AnalyzedStep(
-            index=0,
-            original_tap={"x": 540, "y": 1200, "timestamp": 1.0},
-            element_text=None,
-            before_description="Screen state",
-            after_description="Changed state",
-            suggested_verification=None,
-        )
+        step = make_step(0, 540, 1200, 1.0)
 
         gen.add_analyzed_step(step)
 
-        assert len(gen._steps) == 1
-        assert gen._steps[0] == {"tap": [540, 1200]}
+        assert gen._steps == [{"tap": [540, 1200]}]
 
-    def test_handles_empty_element_text(self):
+    def test_handles_empty_element_text(self, gen):
         """add_analyzed_step should treat empty string as no element_text."""
-        gen = YAMLGenerator("test", "com.example.app")
-        step = AnalyzedStep(
-            index=0,
-            original_tap={"x": 100, "y": 200, "timestamp": 1.0},
-            element_text="",
-            before_description="Screen",
-            after_description="Screen",
-            suggested_verification=None,
-        )
+        step = make_step(0, 100, 200, 1.0, "")
 
         gen.add_analyzed_step(step)
 
         # Empty string is falsy, should use coordinates
-        assert gen._steps[0] == {"tap": [100, 200]}
+        assert gen._steps == [{"tap": [100, 200]}]
 
 
 class TestAddTypingSequence:
     """Test add_typing_sequence method."""
 
-    def test_adds_type_command_when_text_provided(self):
+    def test_adds_type_command_when_text_provided(self, gen):
         """add_typing_sequence should add type command when text is provided."""
-        gen = YAMLGenerator("test", "com.example.app")
         sequence = TypingSequence(
             start_index=2,
             end_index=10,
@@ -524,12 +452,10 @@ class TestAddTypingSequence:
 
         gen.add_typing_sequence(sequence)
 
-        assert len(gen._steps) == 1
-        assert gen._steps[0] == {"type": "user@test.com"}
+        assert gen._steps == [{"type": "user@test.com"}]
 
-    def test_skips_when_no_text_provided(self):
+    def test_skips_when_no_text_provided(self, gen):
         """add_typing_sequence should skip when text is None."""
-        gen = YAMLGenerator("test", "com.example.app")
         sequence = TypingSequence(
             start_index=2,
             end_index=10,
@@ -540,11 +466,10 @@ class TestAddTypingSequence:
 
         gen.add_typing_sequence(sequence)
 
-        assert len(gen._steps) == 0
+        assert gen._steps == []
 
-    def test_skips_when_text_is_empty(self):
+    def test_skips_when_text_is_empty(self, gen):
         """add_typing_sequence should skip when text is empty string."""
-        gen = YAMLGenerator("test", "com.example.app")
         sequence = TypingSequence(
             start_index=2,
             end_index=10,
@@ -556,89 +481,81 @@ class TestAddTypingSequence:
         gen.add_typing_sequence(sequence)
 
         # Empty string is falsy, should skip
-        assert len(gen._steps) == 0
+        assert gen._steps == []
+
+
+# Keyboard taps 1-3 typed as an email; TypingSequence is frozen, so tests can share it
+EMAIL_TYPING = TypingSequence(
+    start_index=1,
+    end_index=3,
+    tap_count=3,
+    duration=1.0,
+    text="user@test.com",
+)
+
+
+# Login -> Submit -> Dashboard flow with a verification after the last two taps.
+# generate_from_analysis only reads its inputs, so tests can share them.
+DASHBOARD_STEPS = (
+    make_step(0, 100, 200, 1.0, "Login"),
+    make_step(1, 200, 300, 2.0, "Submit"),
+    make_step(2, 300, 400, 5.0, "Dashboard"),
+)
+DASHBOARD_VERIFICATIONS = (
+    VerificationPoint(
+        after_step_index=1,
+        description="Loading indicator appears",
+        confidence=0.8,
+        reason="Form submission",
+    ),
+    VerificationPoint(
+        after_step_index=2,
+        description="Menu is displayed",
+        confidence=0.7,
+        reason="Navigation",
+    ),
+)
+# Expected output: tap Login, tap Submit, verify, tap Dashboard, verify
+DASHBOARD_EXPECTED_STEPS = [
+    {"tap": "Login", "at": [100, 200]},
+    {"tap": "Submit", "at": [200, 300]},
+    {"verify_screen": "Loading indicator appears"},
+    {"tap": "Dashboard", "at": [300, 400]},
+    {"verify_screen": "Menu is displayed"},
+]
 
 
 class TestGenerateFromAnalysis:
     """Test generate_from_analysis method."""
 
-    def test_generates_basic_yaml_from_analyzed_steps(self):
+    def test_generates_basic_yaml_from_analyzed_steps(self, gen):
         """generate_from_analysis should create YAML from analyzed steps."""
-        gen = YAMLGenerator("test", "com.example.app")
         analyzed_steps = [
-            AnalyzedStep(
-                index=0,
-                original_tap={"x": 100, "y": 200, "timestamp": 1.0},
-                element_text="Login",
-                before_description="Login screen",
-                after_description="Form focused",
-                suggested_verification=None,
-            ),
-            AnalyzedStep(
-                index=1,
-                original_tap={"x": 300, "y": 400, "timestamp": 2.0},
-                element_text="Submit",
-                before_description="Form filled",
-                after_description="Loading",
-                suggested_verification=None,
-            ),
+            make_step(0, 100, 200, 1.0, "Login"),
+            make_step(1, 300, 400, 2.0, "Submit"),
         ]
 
-        yaml_str = gen.generate_from_analysis(analyzed_steps, [], [])
-        data = yaml.safe_load(yaml_str)
+        gen.generate_from_analysis(analyzed_steps, [], [])
+        data = gen._build_document()
 
-        assert len(data["steps"]) == 2
         # Rich format: element text primary, coordinates as fallback
-        assert data["steps"][0] == {"tap": "Login", "at": [100, 200]}
-        assert data["steps"][1] == {"tap": "Submit", "at": [300, 400]}
+        assert data["steps"] == [
+            {"tap": "Login", "at": [100, 200]},
+            {"tap": "Submit", "at": [300, 400]},
+        ]
 
-    def test_inserts_type_commands_at_correct_positions(self):
+    def test_inserts_type_commands_at_correct_positions(self, gen):
         """generate_from_analysis should replace typing sequence taps with type command."""
-        gen = YAMLGenerator("test", "com.example.app")
-
         # Steps 0, 1, 2 where 1-2 are typing
-        analyzed_steps = [
-            AnalyzedStep(
-                index=0,
-                original_tap={"x": 100, "y": 200, "timestamp": 1.0},
-                element_text="Email field",
-                before_description="Login screen",
-                after_description="Field focused",
-                suggested_verification=None,
-            ),
-            AnalyzedStep(
-                index=1,
-                original_tap={"x": 50, "y": 1800, "timestamp": 2.0},
-                element_text=None,
-                before_description="Keyboard visible",
-                after_description="Typing",
-                suggested_verification=None,
-            ),
-            AnalyzedStep(
-                index=2,
-                original_tap={"x": 60, "y": 1800, "timestamp": 2.5},
-                element_text=None,
-                before_description="Typing",
-                after_description="Typing",
-                suggested_verification=None,
-            ),
-            AnalyzedStep(
-                index=3,
-                original_tap={"x": 70, "y": 1800, "timestamp": 3.0},
-                element_text=None,
-                before_description="Typing",
-                after_description="Typing complete",
-                suggested_verification=None,
-            ),
-            AnalyzedStep(
-                index=4,
-                original_tap={"x": 200, "y": 500, "timestamp": 4.0},
-                element_text="Submit",
-                before_description="Form filled",
-                after_description="Submitting",
-                suggested_verification=None,
-            ),
+        rows = [
+            # (index, x, y, timestamp, element_text)
+            (0, 100, 200, 1.0, "Email field"),
+            (1, 50, 1800, 2.0, None),
+            (2, 60, 1800, 2.5, None),
+            (3, 70, 1800, 3.0, None),
+            (4, 200, 500, 4.0, "Submit"),
         ]
+        analyzed_steps = [make_step(*row) for row in rows]
 
         # Typing sequence covers indices 1-3
         typing_sequences = [
@@ -651,36 +568,21 @@ class TestGenerateFromAnalysis:
             )
         ]
 
-        yaml_str = gen.generate_from_analysis(analyzed_steps, typing_sequences, [])
-        data = yaml.safe_load(yaml_str)
+        gen.generate_from_analysis(analyzed_steps, typing_sequences, [])
+        data = gen._build_document()
 
         # Should have: tap Email field, type text, tap Submit
-        assert len(data["steps"]) == 3
-        assert data["steps"][0] == {"tap": "Email field", "at": [100, 200]}
-        assert data["steps"][1] == {"type": "test@email.com"}
-        assert data["steps"][2] == {"tap": "Submit", "at": [200, 500]}
+        assert data["steps"] == [
+            {"tap": "Email field", "at": [100, 200]},
+            {"type": "test@email.com"},
+            {"tap": "Submit", "at": [200, 500]},
+        ]
 
-    def test_inserts_verify_screen_at_suggested_points(self):
+    def test_inserts_verify_screen_at_suggested_points(self, gen):
         """generate_from_analysis should insert verify_screen after specified steps."""
-        gen = YAMLGenerator("test", "com.example.app")
-
         analyzed_steps = [
-            AnalyzedStep(
-                index=0,
-                original_tap={"x": 100, "y": 200, "timestamp": 1.0},
-                element_text="Login",
-                before_description="Login screen",
-                after_description="Form focused",
-                suggested_verification=None,
-            ),
-            AnalyzedStep(
-                index=1,
-                original_tap={"x": 300, "y": 400, "timestamp": 2.0},
-                element_text="Submit",
-                before_description="Form filled",
-                after_description="Dashboard visible",
-                suggested_verification=None,
-            ),
+            make_step(0, 100, 200, 1.0, "Login"),
+            make_step(1, 300, 400, 2.0, "Submit"),
         ]
 
         verifications = [
@@ -692,64 +594,29 @@ class TestGenerateFromAnalysis:
             )
         ]
 
-        yaml_str = gen.generate_from_analysis(analyzed_steps, [], verifications)
-        data = yaml.safe_load(yaml_str)
+        gen.generate_from_analysis(analyzed_steps, [], verifications)
+        data = gen._build_document()
 
         # Should have: tap Login, tap Submit, verify_screen
-        assert len(data["steps"]) == 3
-        assert data["steps"][0] == {"tap": "Login", "at": [100, 200]}
-        assert data["steps"][1] == {"tap": "Submit", "at": [300, 400]}
-        assert data["steps"][2] == {"verify_screen": "Dashboard is displayed with welcome message"}
+        assert data["steps"] == [
+            {"tap": "Login", "at": [100, 200]},
+            {"tap": "Submit", "at": [300, 400]},
+            {"verify_screen": "Dashboard is displayed with welcome message"},
+        ]
 
-    def test_handles_overlapping_typing_and_verifications(self):
+    def test_handles_overlapping_typing_and_verifications(self, gen):
         """generate_from_analysis should handle typing sequences with verification at end."""
-        gen = YAMLGenerator("test", "com.example.app")
-
-        analyzed_steps = [
-            AnalyzedStep(
-                index=0,
-                original_tap={"x": 100, "y": 200, "timestamp": 1.0},
-                element_text="Email field",
-                before_description="Login screen",
-                after_description="Field focused",
-                suggested_verification=None,
-            ),
-            AnalyzedStep(
-                index=1,
-                original_tap={"x": 50, "y": 1800, "timestamp": 2.0},
-                element_text=None,
-                before_description="Keyboard",
-                after_description="Typing",
-                suggested_verification=None,
-            ),
-            AnalyzedStep(
-                index=2,
-                original_tap={"x": 60, "y": 1800, "timestamp": 2.5},
-                element_text=None,
-                before_description="Typing",
-                after_description="Typing",
-                suggested_verification=None,
-            ),
-            AnalyzedStep(
-                index=3,
-                original_tap={"x": 70, "y": 1800, "timestamp": 3.0},
-                element_text=None,
-                before_description="Typing",
-                after_description="Email entered",
-                suggested_verification=None,
-            ),
+        rows = [
+            # (index, x, y, timestamp, element_text)
+            (0, 100, 200, 1.0, "Email field"),
+            (1, 50, 1800, 2.0, None),
+            (2, 60, 1800, 2.5, None),
+            (3, 70, 1800, 3.0, None),
         ]
+        analyzed_steps = [make_step(*row) for row in rows]
 
         # Typing sequence covers indices 1-3
-        typing_sequences = [
-            TypingSequence(
-                start_index=1,
-                end_index=3,
-                tap_count=3,
-                duration=1.0,
-                text="user@test.com",
-            )
-        ]
+        typing_sequences = [EMAIL_TYPING]
 
         # Verification after last typing step
         verifications = [
@@ -761,102 +628,34 @@ class TestGenerateFromAnalysis:
             )
         ]
 
-        yaml_str = gen.generate_from_analysis(analyzed_steps, typing_sequences, verifications)
-        data = yaml.safe_load(yaml_str)
+        gen.generate_from_analysis(analyzed_steps, typing_sequences, verifications)
+        data = gen._build_document()
 
         # Should have: tap Email field, type text, verify_screen
-        assert len(data["steps"]) == 3
-        assert data["steps"][0] == {"tap": "Email field", "at": [100, 200]}
-        assert data["steps"][1] == {"type": "user@test.com"}
-        assert data["steps"][2] == {"verify_screen": "Email field shows entered text"}
+        assert data["steps"] == [
+            {"tap": "Email field", "at": [100, 200]},
+            {"type": "user@test.com"},
+            {"verify_screen": "Email field shows entered text"},
+        ]
 
-    def test_handles_multiple_typing_sequences(self):
+    def test_handles_multiple_typing_sequences(self, gen):
         """generate_from_analysis should handle multiple typing sequences."""
-        gen = YAMLGenerator("test", "com.example.app")
-
-        analyzed_steps = [
-            AnalyzedStep(
-                index=0,
-                original_tap={"x": 100, "y": 200, "timestamp": 1.0},
-                element_text="Email",
-                before_description="Form",
-                after_description="Email focused",
-                suggested_verification=None,
-            ),
-            AnalyzedStep(
-                index=1,
-                original_tap={"x": 50, "y": 1800, "timestamp": 2.0},
-                element_text=None,
-                before_description="Keyboard",
-                after_description="Typing",
-                suggested_verification=None,
-            ),
-            AnalyzedStep(
-                index=2,
-                original_tap={"x": 60, "y": 1800, "timestamp": 2.5},
-                element_text=None,
-                before_description="Typing",
-                after_description="Typing",
-                suggested_verification=None,
-            ),
-            AnalyzedStep(
-                index=3,
-                original_tap={"x": 70, "y": 1800, "timestamp": 3.0},
-                element_text=None,
-                before_description="Typing",
-                after_description="Email done",
-                suggested_verification=None,
-            ),
-            AnalyzedStep(
-                index=4,
-                original_tap={"x": 100, "y": 400, "timestamp": 4.0},
-                element_text="Password",
-                before_description="Email filled",
-                after_description="Password focused",
-                suggested_verification=None,
-            ),
-            AnalyzedStep(
-                index=5,
-                original_tap={"x": 80, "y": 1800, "timestamp": 5.0},
-                element_text=None,
-                before_description="Keyboard",
-                after_description="Typing",
-                suggested_verification=None,
-            ),
-            AnalyzedStep(
-                index=6,
-                original_tap={"x": 90, "y": 1800, "timestamp": 5.5},
-                element_text=None,
-                before_description="Typing",
-                after_description="Typing",
-                suggested_verification=None,
-            ),
-            AnalyzedStep(
-                index=7,
-                original_tap={"x": 95, "y": 1800, "timestamp": 6.0},
-                element_text=None,
-                before_description="Typing",
-                after_description="Password done",
-                suggested_verification=None,
-            ),
-            AnalyzedStep(
-                index=8,
-                original_tap={"x": 200, "y": 600, "timestamp": 7.0},
-                element_text="Login",
-                before_description="Form complete",
-                after_description="Logging in",
-                suggested_verification=None,
-            ),
+        rows = [
+            # (index, x, y, timestamp, element_text)
+            (0, 100, 200, 1.0, "Email"),
+            (1, 50, 1800, 2.0, None),
+            (2, 60, 1800, 2.5, None),
+            (3, 70, 1800, 3.0, None),
+            (4, 100, 400, 4.0, "Password"),
+            (5, 80, 1800, 5.0, None),
+            (6, 90, 1800, 5.5, None),
+            (7, 95, 1800, 6.0, None),
+            (8, 200, 600, 7.0, "Login"),
         ]
+        analyzed_steps = [make_step(*row) for row in rows]
 
         typing_sequences = [
-            TypingSequence(
-                start_index=1,
-                end_index=3,
-                tap_count=3,
-                duration=1.0,
-                text="user@test.com",
-            ),
+            EMAIL_TYPING,
             TypingSequence(
                 start_index=5,
                 end_index=7,
@@ -866,72 +665,34 @@ class TestGenerateFromAnalysis:
             ),
         ]
 
-        yaml_str = gen.generate_from_analysis(analyzed_steps, typing_sequences, [])
-        data = yaml.safe_load(yaml_str)
+        gen.generate_from_analysis(analyzed_steps, typing_sequences, [])
+        data = gen._build_document()
 
         # Should have: tap Email, type email, tap Password, type password, tap Login
-        assert len(data["steps"]) == 5
-        assert data["steps"][0] == {"tap": "Email", "at": [100, 200]}
-        assert data["steps"][1] == {"type": "user@test.com"}
-        assert data["steps"][2] == {"tap": "Password", "at": [100, 400]}
-        assert data["steps"][3] == {"type": "secret123"}
-        assert data["steps"][4] == {"tap": "Login", "at": [200, 600]}
-
-    def test_handles_empty_inputs(self):
-        """generate_from_analysis should handle empty inputs gracefully."""
-        gen = YAMLGenerator("test", "com.example.app")
+        assert data["steps"] == [
+            {"tap": "Email", "at": [100, 200]},
+            {"type": "user@test.com"},
+            {"tap": "Password", "at": [100, 400]},
+            {"type": "secret123"},
+            {"tap": "Login", "at": [200, 600]},
+        ]
 
+    def test_handles_empty_inputs(self, gen):
+        """generate_from_analysis should handle empty inputs gracefully."""
         yaml_str = gen.generate_from_analysis([], [], [])
-        data = yaml.safe_load(yaml_str)
+        data = load_yaml(yaml_str)
 
         assert data["config"]["app"] == "com.example.app"
         assert data["steps"] == []
 
-    def test_skips_typing_sequence_without_text(self):
+    def test_skips_typing_sequence_without_text(self, gen):
         """Skip typing sequences with no text (user skipped interview)."""
-        gen = YAMLGenerator("test", "com.example.app")
-
         analyzed_steps = [
-            AnalyzedStep(
-                index=0,
-                original_tap={"x": 100, "y": 200, "timestamp": 1.0},
-                element_text="Email",
-                before_description="Form",
-                after_description="Focused",
-                suggested_verification=None,
-            ),
-            AnalyzedStep(
-                index=1,
-                original_tap={"x": 50, "y": 1800, "timestamp": 2.0},
-                element_text=None,
-                before_description="Keyboard",
-                after_description="Typing",
-                suggested_verification=None,
-            ),
-            AnalyzedStep(
-                index=2,
-                original_tap={"x": 60, "y": 1800, "timestamp": 2.5},
-                element_text=None,
-                before_description="Typing",
-                after_description="Typing",
-                suggested_verification=None,
-            ),
-            AnalyzedStep(
-                index=3,
-                original_tap={"x": 70, "y": 1800, "timestamp": 3.0},
-                element_text=None,
-                before_description="Typing",
-                after_description="Done",
-                suggested_verification=None,
-            ),
-            AnalyzedStep(
-                index=4,
-                original_tap={"x": 200, "y": 500, "timestamp": 4.0},
-                element_text="Submit",
-                before_description="Filled",
-                after_description="Submitting",
-                suggested_verification=None,
-            ),
+            make_step(0, 100, 200, 1.0, "Email"),
+            make_step(1, 50, 1800, 2.0),
+            make_step(2, 60, 1800, 2.5),
+            make_step(3, 70, 1800, 3.0),
+            make_step(4, 200, 500, 4.0, "Submit"),
         ]
 
         # Typing sequence without text (user skipped)
@@ -945,68 +706,22 @@ class TestGenerateFromAnalysis:
             )
         ]
 
-        yaml_str = gen.generate_from_analysis(analyzed_steps, typing_sequences, [])
-        data = yaml.safe_load(yaml_str)
+        gen.generate_from_analysis(analyzed_steps, typing_sequences, [])
+        data = gen._build_document()
 
         # Without text, typing taps are skipped entirely (no type command generated)
         # Result: tap Email, tap Submit
-        assert len(data["steps"]) == 2
-        assert data["steps"][0] == {"tap": "Email", "at": [100, 200]}
-        assert data["steps"][1] == {"tap": "Submit", "at": [200, 500]}
-
-    def test_multiple_verifications_at_different_steps(self):
-        """generate_from_analysis should insert multiple verifications at correct positions."""
-        gen = YAMLGenerator("test", "com.example.app")
-
-        analyzed_steps = [
-            AnalyzedStep(
-                index=0,
-                original_tap={"x": 100, "y": 200, "timestamp": 1.0},
-                element_text="Login",
-                before_description="Login screen",
-                after_description="Form",
-                suggested_verification=None,
-            ),
-            AnalyzedStep(
-                index=1,
-                original_tap={"x": 200, "y": 300, "timestamp": 2.0},
-                element_text="Submit",
-                before_description="Form",
-                after_description="Loading",
-                suggested_verification=None,
-            ),
-            AnalyzedStep(
-                index=2,
-                original_tap={"x": 300, "y": 400, "timestamp": 5.0},
-                element_text="Dashboard",
-                before_description="Dashboard",
-                after_description="Menu",
-                suggested_verification=None,
-            ),
+        assert data["steps"] == [
+            {"tap": "Email", "at": [100, 200]},
+            {"tap": "Submit", "at": [200, 500]},
         ]
 
-        verifications = [
-            VerificationPoint(
-                after_step_index=1,
-                description="Loading indicator appears",
-                confidence=0.8,
-                reason="Form submission",
-            ),
-            VerificationPoint(
-                after_step_index=2,
-                description="Menu is displayed",
-                confidence=0.7,
-                reason="Navigation",
-            ),
-        ]
+    def test_multiple_verifications_at_different_steps(self, gen):
+        """generate_from_analysis should insert multiple verifications at correct positions."""
+        analyzed_steps = list(DASHBOARD_STEPS)
+        verifications = list(DASHBOARD_VERIFICATIONS)
 
-        yaml_str = gen.generate_from_analysis(analyzed_steps, [], verifications)
-        data = yaml.safe_load(yaml_str)
+        gen.generate_from_analysis(analyzed_steps, [], verifications)
+        data = gen._build_document()
 
-        # Should have: tap Login, tap Submit, verify, tap Dashboard, verify
-        assert len(data["steps"]) == 5
-        assert data["steps"][0] == {"tap": "Login", "at": [100, 200]}
-        assert data["steps"][1] == {"tap": "Submit", "at": [200, 300]}
-        assert data["steps"][2] == {"verify_screen": "Loading indicator appears"}
-        assert data["steps"][3] == {"tap": "Dashboard", "at": [300, 400]}
-        assert data["steps"][4] == {"verify_screen": "Menu is displayed"}
+        assert data["steps"] == DASHBOARD_EXPECTED_STEPS